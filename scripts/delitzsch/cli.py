@@ -1,18 +1,45 @@
 """Command-line interface for Delitzsch Hebrew New Testament extraction."""
 
 import argparse
+import importlib.util
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-
-from .constants import DEFAULT_OUTPUT_DIR, DEFAULT_REPO_DIR, NEW_TESTAMENT_BOOKS
-from .converter import convert_books_to_json, validate_all_converted_books
-from .downloader import ensure_repository, locate_delitzsch_files
+from typing import List, Optional
+
+from .constants import (
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_REPO_DIR,
+    HTML_DIR,
+    NEW_TESTAMENT_BOOKS,
+    NEW_TESTAMENT_BOOK_KEYS,
+    NEW_TESTAMENT_BOOK_LIST,
+    REPOSITORY_BRANCH,
+)
+from .converter import (
+    conversion_stamp,
+    convert_books_to_json,
+    load_conversion_state,
+    save_conversion_state,
+    validate_all_converted_books,
+)
+from .downloader import (
+    HAS_REQUESTS,
+    download_html_files_directly,
+    ensure_repository,
+    get_local_head,
+    get_remote_head,
+    locate_delitzsch_files,
+)
 from .parser import parse_html_files
 
 logger = logging.getLogger(__name__)
 
+# (import name, pip package name) pairs required for processing
+_REQUIRED_PACKAGES = (('lxml', 'lxml'),)
+
 
 def setup_logging(verbose: bool = False):
     """Configure logging."""
@@ -26,25 +53,23 @@ def setup_logging(verbose: bool = False):
 def check_dependencies():
     """Check if required packages are installed."""
     missing = []
-    for pkg, name in [('bs4', 'beautifulsoup4'), ('lxml', 'lxml')]:
-        try:
-            __import__(pkg)
-        except ImportError:
+    for pkg, name in _REQUIRED_PACKAGES:
+        # find_spec locates the package without importing it
+        if importlib.util.find_spec(pkg) is None:
             missing.append(name)
 
     if missing:
-        logger.error(f"Missing dependencies: {', '.join(missing)}")
-        logger.info(f"Install with: pip install {' '.join(missing)}")
+        logger.error("Missing dependencies: %s", ', '.join(missing))
+        logger.info("Install with: pip install %s", ' '.join(missing))
         sys.exit(1)
 
 
 def check_dependencies_optional():
     """Check if required packages are installed, but don't exit."""
     missing = []
-    for pkg, name in [('bs4', 'beautifulsoup4'), ('lxml', 'lxml')]:
-        try:
-            __import__(pkg)
-        except ImportError:
+    for pkg, name in _REQUIRED_PACKAGES:
+        # find_spec locates the package without importing it
+        if importlib.util.find_spec(pkg) is None:
             missing.append(name)
 
     return missing
@@ -66,16 +91,13 @@ def list_books():
 
 def validate_books(book_names: List[str]) -> List[str]:
     """Validate book names."""
-    invalid = []
-    valid = []
-
-    for book in book_names:
-        if book.lower() == 'all':
-            return list(NEW_TESTAMENT_BOOKS.keys())
-        elif book.lower() in NEW_TESTAMENT_BOOKS:
-            valid.append(book.lower())
-        else:
-            invalid.append(book)
+    lowered = [book.lower() for book in book_names]
+
+    if 'all' in lowered:
+        return list(NEW_TESTAMENT_BOOK_LIST)
+
+    valid = [book for book in lowered if book in NEW_TESTAMENT_BOOK_KEYS]
+    invalid = [book for book, key in zip(book_names, lowered) if key not in NEW_TESTAMENT_BOOK_KEYS]
 
     if invalid:
         print(f"Error: Unknown books: {', '.join(invalid)}")
@@ -85,6 +107,37 @@ def validate_books(book_names: List[str]) -> List[str]:
     return valid
 
 
+def _validate_output(book_names: List[str], output_dir: str) -> bool:
+    """
+    Validate the converted JSON files of the given books.
+
+    Args:
+        book_names: Books whose output should be validated
+        output_dir: Directory containing the JSON files
+
+    Returns:
+        True if every book passed validation, False otherwise
+    """
+    logger.info("Validating output JSON files...")
+    validation_results = validate_all_converted_books(book_names, output_dir=output_dir)
+
+    # Check if all validations passed
+    if not all(validation_results.values()):
+        failed_books = [book for book, success in validation_results.items() if not success]
+        logger.error("Validation failed for books: %s", ', '.join(failed_books))
+        return False
+    return True
+
+
+def positive_int(value: str) -> int:
+    """Parse a command-line value as an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser."""
     parser = argparse.ArgumentParser(
@@ -120,6 +173,8 @@ Note: If git cloning fails, try --download-direct for individual file downloads
     parser.add_argument('--validate', action='store_true', help='Validate output JSON files after conversion')
     parser.add_argument('--download-direct', action='store_true', help='Download HTML files directly instead of cloning repository')
     parser.add_argument('--use-existing', action='store_true', help='Use existing HTML files without repository operations')
+    parser.add_argument('--jobs', '-j', type=positive_int, default=None, help='Worker processes for HTML parsing (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Reparse HTML files instead of reusing cached parses')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
 
     return parser
@@ -134,7 +189,9 @@ def process_books(
     explore_only: bool = False,
     validate_output: bool = False,
     download_direct: bool = False,
-    use_existing: bool = False
+    use_existing: bool = False,
+    jobs: Optional[int] = None,
+    no_cache: bool = False
 ) -> bool:
     """
     Main processing function.
@@ -147,15 +204,22 @@ def process_books(
         dry_run: Dry run mode
         explore_only: Only explore HTML structure
         validate_output: Validate output after conversion
+        download_direct: Download HTML files directly instead of cloning
+        use_existing: Use existing HTML files without repository operations
+        jobs: Worker processes for HTML parsing (None for CPU count)
+        no_cache: Reparse HTML files instead of reusing cached parses
 
     Returns:
         True if processing successful, False otherwise
     """
+    source_head = None
+    state = {}
+
     try:
         # For dry-run, skip actual repository and parsing operations
         if dry_run:
             logger.info("DRY RUN: Simulating processing without actual operations")
-            logger.info(f"Would process books: {', '.join(book_names)}")
+            logger.info("Would process books: %s", ', '.join(book_names))
             logger.info("Would clone/update repository and parse HTML files")
             logger.info("Would convert to JSON format in data/delitzsch/")
             return True
@@ -163,18 +227,18 @@ def process_books(
         if use_existing:
             # Use existing HTML files in repo_path
             logger.info("Using existing HTML files...")
-            import os
-            if not os.path.exists(repo_path):
-                logger.error(f"Repository path does not exist: {repo_path}")
+            # One directory listing checks both the repository and its html/ subdirectory
+            try:
+                with os.scandir(repo_path) as entries:
+                    has_html_dir = any(entry.name == HTML_DIR and entry.is_dir() for entry in entries)
+            except OSError as e:
+                logger.error("Repository path is not accessible: %s (%s)", repo_path, e.strerror)
                 return False
-            html_dir = os.path.join(repo_path, 'html')
-            if not os.path.exists(html_dir):
-                logger.error(f"HTML directory does not exist: {html_dir}")
+            if not has_html_dir:
+                logger.error("HTML directory does not exist: %s", os.path.join(repo_path, HTML_DIR))
                 return False
 
             # Find existing HTML files
-            from .downloader import locate_delitzsch_files
-            from pathlib import Path
             html_files = locate_delitzsch_files(Path(repo_path), book_filter=book_names)
             if not html_files:
                 logger.error("No HTML files found for requested books")
@@ -182,7 +246,6 @@ def process_books(
         elif download_direct:
             # Use direct download mode
             logger.info("Using direct download mode...")
-            from .downloader import download_html_files_directly
             html_files = download_html_files_directly(
                 output_dir=Path(repo_path),
                 books=book_names
@@ -191,33 +254,81 @@ def process_books(
                 logger.error("Failed to download HTML files automatically")
                 logger.info("You can manually download the HTML files from:")
                 logger.info("https://github.com/hebrew-bible/hebrew-bible.github.io/tree/master/html")
-                logger.info(f"And place them in: {repo_path}")
+                logger.info("And place them in: %s", repo_path)
                 return False
         else:
-            # Use repository cloning mode
-            logger.info("Ensuring repository is available...")
-            repo_path_obj = ensure_repository(
-                repo_path=Path(repo_path) if repo_path != str(DEFAULT_REPO_DIR) else None,
-                force_clone=force_clone
-            )
+            remote_head = None
+
+            # Skip books already converted from the current upstream commit
+            # by the current parser and converter
+            if not force_clone and not explore_only:
+                remote_head = get_remote_head()
+                if remote_head:
+                    state = load_conversion_state(output_dir)
+                    stamp = conversion_stamp(remote_head)
+                    pending_books = [
+                        book for book in book_names
+                        if state.get(book) != stamp or not (Path(output_dir) / f"{book}.json").exists()
+                    ]
+                    if not pending_books:
+                        logger.info("All requested books are up to date with upstream %s", remote_head[:12])
+                        if validate_output:
+                            return _validate_output(book_names, output_dir)
+                        return True
+                    if len(pending_books) < len(book_names):
+                        logger.info("Skipping %d books already up to date", len(book_names) - len(pending_books))
+                    book_names = pending_books
+
+            # Only the HTML files are needed, so fetch them directly when possible
+            # (into the repository's html/ layout) and clone only as a fallback
+            html_files = []
+            if HAS_REQUESTS and book_names and not force_clone:
+                logger.info("Downloading HTML files directly...")
+                # Pin the files to the commit the state will record, since the
+                # branch URLs are served from a CDN that may lag behind it
+                html_files = download_html_files_directly(
+                    output_dir=Path(repo_path) / HTML_DIR,
+                    books=book_names,
+                    ref=remote_head or REPOSITORY_BRANCH
+                )
+                if len(html_files) < len(book_names):
+                    logger.warning(
+                        "Direct download incomplete (%d/%d files), falling back to repository clone",
+                        len(html_files), len(book_names)
+                    )
+                    html_files = []
+                else:
+                    source_head = remote_head
 
-            if not repo_path_obj:
-                logger.error("Failed to access repository")
-                logger.info("Alternative: Try using --download-direct option")
-                return False
+            if not html_files:
+                # Use repository cloning mode
+                logger.info("Ensuring repository is available...")
+                repo_path_obj = ensure_repository(
+                    repo_path=Path(repo_path) if repo_path != str(DEFAULT_REPO_DIR) else None,
+                    force_clone=force_clone,
+                    remote_head=remote_head
+                )
 
-            # Locate HTML files
-            logger.info("Locating HTML files...")
-            from .downloader import locate_delitzsch_files
-            html_files = locate_delitzsch_files(repo_path_obj, book_filter=book_names)
+                if not repo_path_obj:
+                    logger.error("Failed to access repository")
+                    logger.info("Alternative: Try using --download-direct option")
+                    return False
 
-            if not html_files:
-                logger.error("No HTML files found in repository for requested books")
-                return False
+                # Locate HTML files
+                logger.info("Locating HTML files...")
+                html_files = locate_delitzsch_files(repo_path_obj, book_filter=book_names)
+
+                if not html_files:
+                    logger.error("No HTML files found in repository for requested books")
+                    return False
+
+                source_head = get_local_head(repo_path_obj)
 
         # Parse HTML files
-        logger.info(f"Parsing {len(html_files)} HTML files...")
-        books_data = parse_html_files(html_files, explore_only=explore_only)
+        logger.info("Parsing %d HTML files...", len(html_files))
+        books_data = parse_html_files(
+            html_files, explore_only=explore_only, max_workers=jobs, no_cache=no_cache
+        )
 
         if not books_data:
             logger.error("No book data extracted from HTML files")
@@ -239,13 +350,13 @@ def process_books(
             return True
 
         # Filter books if specific books requested
-        if book_names and book_names != list(NEW_TESTAMENT_BOOKS.keys()):
+        if book_names and tuple(book_names) != NEW_TESTAMENT_BOOK_LIST:
             filtered_books = {}
             for book_name in book_names:
                 if book_name in books_data:
                     filtered_books[book_name] = books_data[book_name]
                 else:
-                    logger.warning(f"Requested book '{book_name}' not found in parsed data")
+                    logger.warning("Requested book '%s' not found in parsed data", book_name)
             books_data = filtered_books
 
         if not books_data:
@@ -253,25 +364,24 @@ def process_books(
             return False
 
         # Convert to JSON
-        logger.info(f"Converting {len(books_data)} books to JSON...")
+        logger.info("Converting %d books to JSON...", len(books_data))
         conversion_results = convert_books_to_json(
             books_data=books_data,
             output_dir=output_dir,
             dry_run=dry_run
         )
 
+        # Record what each successfully converted book was built from
+        if source_head:
+            if not state:
+                state = load_conversion_state(output_dir)
+            stamp = conversion_stamp(source_head)
+            state.update({book: stamp for book, success in conversion_results.items() if success})
+            save_conversion_state(state, output_dir)
+
         # Validate output if requested
         if validate_output and not dry_run:
-            logger.info("Validating output JSON files...")
-            validation_results = validate_all_converted_books(
-                list(conversion_results.keys()),
-                output_dir=output_dir
-            )
-
-            # Check if all validations passed
-            if not all(validation_results.values()):
-                failed_books = [book for book, success in validation_results.items() if not success]
-                logger.error(f"Validation failed for books: {', '.join(failed_books)}")
+            if not _validate_output(list(conversion_results.keys()), output_dir):
                 return False
 
         # Check conversion results
@@ -283,11 +393,11 @@ def process_books(
             return True
         else:
             failed_books = [book for book, success in conversion_results.items() if not success]
-            logger.error(f"Failed to process books: {', '.join(failed_books)}")
+            logger.error("Failed to process books: %s", ', '.join(failed_books))
             return False
 
     except Exception as e:
-        logger.error(f"Error during processing: {e}")
+        logger.error("Error during processing: %s", e)
         return False
 
 
@@ -306,23 +416,23 @@ def main():
     if not args.explore_only and not args.dry_run:
         missing_deps = check_dependencies_optional()
         if missing_deps:
-            logger.error(f"Missing dependencies required for processing: {', '.join(missing_deps)}")
-            logger.info(f"Install with: pip install {' '.join(missing_deps)}")
+            logger.error("Missing dependencies required for processing: %s", ', '.join(missing_deps))
+            logger.info("Install with: pip install %s", ' '.join(missing_deps))
             sys.exit(1)
     elif args.explore_only:
         # For exploration, check but don't fail
         missing_deps = check_dependencies_optional()
         if missing_deps:
-            logger.warning(f"Missing dependencies (exploration may not work): {', '.join(missing_deps)}")
+            logger.warning("Missing dependencies (exploration may not work): %s", ', '.join(missing_deps))
     elif args.dry_run:
         # For dry-run, warn about missing dependencies but continue
         missing_deps = check_dependencies_optional()
         if missing_deps:
-            logger.warning(f"Missing dependencies (dry-run will show what would be processed): {', '.join(missing_deps)}")
+            logger.warning("Missing dependencies (dry-run will show what would be processed): %s", ', '.join(missing_deps))
 
     # Determine books to process
     if args.all:
-        book_names = list(NEW_TESTAMENT_BOOKS.keys())
+        book_names = list(NEW_TESTAMENT_BOOK_LIST)
     elif args.book:
         book_names = validate_books([args.book])
     elif args.books:
@@ -348,7 +458,9 @@ def main():
         explore_only=args.explore_only,
         validate_output=args.validate,
         download_direct=args.download_direct,
-        use_existing=args.use_existing
+        use_existing=args.use_existing,
+        jobs=args.jobs,
+        no_cache=args.no_cache
     )
 
     if not success:
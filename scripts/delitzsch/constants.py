@@ -8,12 +8,25 @@ from pathlib import Path
 # Repository information
 REPOSITORY_URL = "https://github.com/hebrew-bible/hebrew-bible.github.io.git"
 REPOSITORY_NAME = "hebrew-bible.github.io"
+REPOSITORY_BRANCH = "master"
+# Raw file URLs are RAW_CONTENT_BASE_URL/<branch or commit SHA>/<path>
+RAW_CONTENT_BASE_URL = f"https://raw.githubusercontent.com/hebrew-bible/{REPOSITORY_NAME}"
+RAW_HTML_BASE_URL = f"{RAW_CONTENT_BASE_URL}/{REPOSITORY_BRANCH}/html"
 
 # Default paths
-DEFAULT_CACHE_DIR = Path("/tmp/shafan_cache")
+# The clone is kept in the user cache so reruns only fetch new commits
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "shafan"
 DEFAULT_REPO_DIR = DEFAULT_CACHE_DIR / REPOSITORY_NAME
+# Parsed book data, reused while the source HTML file is unchanged
+PARSE_CACHE_DIR = DEFAULT_CACHE_DIR / "parsed"
 DEFAULT_OUTPUT_DIR = "data/delitzsch"
 
+# Per-book record of the upstream commit each output file was built from
+STATE_FILENAME = ".shafan_state.json"
+
+# Sidecar suffix holding the hash of the parsed data each book file was written from
+SOURCE_HASH_SUFFIX = ".sha"
+
 # New Testament books available in Delitzsch translation
 # Based on the Hutter Polyglot Bible book list
 NEW_TESTAMENT_BOOKS = {
@@ -46,6 +59,10 @@ NEW_TESTAMENT_BOOKS = {
     "revelation": "Revelation",
 }
 
+# Precomputed views of the book keys (canonical order and O(1) membership)
+NEW_TESTAMENT_BOOK_LIST = tuple(NEW_TESTAMENT_BOOKS)
+NEW_TESTAMENT_BOOK_KEYS = frozenset(NEW_TESTAMENT_BOOKS)
+
 # Mapping from internal book names to HTML filenames in the repository
 HTML_FILENAME_MAPPING = {
     "matthew": "matthew",
@@ -77,16 +94,15 @@ HTML_FILENAME_MAPPING = {
     "revelation": "revelation",
 }
 
+# Reverse lookup from lowercase HTML filename (without extension) to internal book name
+REVERSE_HTML_MAPPING = {html_name.lower(): book for book, html_name in HTML_FILENAME_MAPPING.items()}
+
 # HTML directory structure patterns
 # The repository likely has HTML files in html/ subdirectory
 HTML_DIR = "html"
 
-# Common HTML file patterns for Delitzsch translation
-# These may need adjustment after exploring the repository structure
-HTML_PATTERNS = [
-    "*.html",
-    "**/*.html"
-]
+# File extensions recognized as HTML (matched case-insensitively)
+HTML_EXTENSIONS = (".html", ".htm")
 
 # Author and publication information
 AUTHOR_NAME = "Franz Delitzsch"
@@ -97,4 +113,13 @@ PUBLICATION_YEAR = "1877"
 DEFAULT_ENCODING = "utf-8"
 
 # Timeout for repository operations (in seconds)
-REPO_TIMEOUT = 300  # 5 minutes
\ No newline at end of file
+REPO_TIMEOUT = 300  # 5 minutes
+
+# Concurrent HTTP requests in direct download mode
+DOWNLOAD_WORKERS = 8
+
+# Bytes written per chunk when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# ETag/Last-Modified validators of directly downloaded HTML files
+HTTP_CACHE_FILENAME = ".etag.json"
\ No newline at end of file
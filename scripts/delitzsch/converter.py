@@ -2,16 +2,156 @@
 Conversion logic for transforming parsed Delitzsch data to Shafan JSON format.
 """
 
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-from .constants import AUTHOR_NAME, PUBLICATION_YEAR
-from .parser import DelitzschParser
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+from .constants import AUTHOR_NAME, PUBLICATION_YEAR, SOURCE_HASH_SUFFIX, STATE_FILENAME
+from .parser import PARSER_VERSION, DelitzschParser
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever conversion changes the JSON it writes, so existing books are rewritten
+CONVERTER_VERSION = 1
+
+
+def dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes with 2-space indentation.
+
+    Uses orjson when available; the stdlib fallback produces identical output.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def load_json_bytes(content: bytes) -> Any:
+    """
+    Deserialize a UTF-8 JSON document.
+
+    Args:
+        content: Encoded JSON document
+
+    Returns:
+        Decoded data
+    """
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content.decode('utf-8'))
+
+
+def conversion_stamp(source_head: str) -> List[Any]:
+    """
+    Identify what a book file is built from, as recorded in the conversion state.
+
+    Args:
+        source_head: Upstream commit SHA the HTML files came from
+
+    Returns:
+        [commit SHA, parser version, converter version]; a book only counts as
+        up to date while all three match
+    """
+    return [source_head, PARSER_VERSION, CONVERTER_VERSION]
+
+
+def load_conversion_state(output_dir: str = "data/delitzsch") -> Dict[str, Any]:
+    """
+    Load the record of what each book was converted from.
+
+    Args:
+        output_dir: Directory containing the JSON files
+
+    Returns:
+        Dictionary mapping book names to conversion stamps (empty if no state yet)
+    """
+    state_file = Path(output_dir) / STATE_FILENAME
+    if not state_file.exists():
+        return {}
+
+    try:
+        state = load_json_bytes(state_file.read_bytes())
+        return state if isinstance(state, dict) else {}
+    except Exception as e:
+        logger.warning("Ignoring unreadable state file %s: %s", state_file, e)
+        return {}
+
+
+def save_conversion_state(state: Dict[str, Any], output_dir: str = "data/delitzsch") -> bool:
+    """
+    Save the record of what each book was converted from.
+
+    Args:
+        state: Dictionary mapping book names to conversion stamps
+        output_dir: Directory containing the JSON files
+
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    try:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        (output_path / STATE_FILENAME).write_bytes(dump_json_bytes(state))
+        return True
+    except Exception as e:
+        logger.error("Error saving conversion state: %s", e)
+        return False
+
+
+def _convert_chapter(chapter: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reshape a parsed chapter into the output chapter structure.
+
+    Args:
+        chapter: Parsed chapter data
+
+    Returns:
+        Chapter dictionary ready for serialization
+    """
+    # Adapt verse format to match existing JSON structure
+    # Remove source_files and visual_uncertainty since we don't have images
+    return {
+        "hebrew_letter": chapter.get('hebrew_letter', ''),
+        "number": chapter.get('number', 0),
+        "verses": [
+            {
+                "number": verse.get('number', 0),
+                "text_nikud": verse.get('text_nikud', '').strip()
+            }
+            for verse in chapter.get('verses', [])
+        ]
+    }
+
+
+def _source_hash(header: bytes, chapters: List[Dict[str, Any]]) -> str:
+    """Hash the inputs that determine a book file's content, including the converter version."""
+    digest = hashlib.blake2b(b'%d\n' % CONVERTER_VERSION, digest_size=16)
+    digest.update(header)
+    digest.update(dump_json_bytes({"chapters": chapters}))
+    return digest.hexdigest()
+
+
+def _indent_json(content: bytes, prefix: bytes) -> bytes:
+    """Indent every line of a serialized JSON document (strings never contain raw newlines)."""
+    return prefix + content.replace(b"\n", b"\n" + prefix)
+
 
 def convert_book_to_json(book_data: Dict[str, Any], output_dir: Path) -> bool:
     """
@@ -30,74 +170,72 @@ def convert_book_to_json(book_data: Dict[str, Any], output_dir: Path) -> bool:
             logger.error("Book data missing book_name")
             return False
 
-        # Build the output data structure
-        output_data = {
-            "book_name": book_name,
-            "author": AUTHOR_NAME,
-            "publication_year": PUBLICATION_YEAR,
-            "chapters": []
-        }
-
         chapters = book_data.get('chapters', [])
         if not chapters:
-            logger.warning(f"No chapters found for book {book_name}")
+            logger.warning("No chapters found for book %s", book_name)
             return False
 
-        # Convert chapters
-        converted_chapters = []
-        for chapter in chapters:
-            converted_chapter = {
-                "hebrew_letter": chapter.get('hebrew_letter', ''),
-                "number": chapter.get('number', 0),
-                "verses": []
-            }
-
-            verses = chapter.get('verses', [])
-            for verse in verses:
-                # Adapt verse format to match existing JSON structure
-                # Remove source_files and visual_uncertainty since we don't have images
-                converted_verse = {
-                    "number": verse.get('number', 0),
-                    "text_nikud": verse.get('text_nikud', '').strip()
-                }
-                converted_chapter["verses"].append(converted_verse)
+        # Book header, re-opened so chapters can be appended one at a time
+        header = dump_json_bytes({
+            "book_name": book_name,
+            "author": AUTHOR_NAME,
+            "publication_year": PUBLICATION_YEAR,
+        })
+        header = header[:header.rindex(b"\n}")] + b',\n  "chapters": ['
 
-            converted_chapters.append(converted_chapter)
+        # Skip the write if the existing file was produced from identical data
+        output_file = output_dir / f"{book_name}.json"
+        hash_file = output_dir / f"{book_name}.json{SOURCE_HASH_SUFFIX}"
+        source_hash = _source_hash(header, chapters)
 
-        output_data["chapters"] = converted_chapters
+        if output_file.exists() and hash_file.exists():
+            if hash_file.read_text(encoding='utf-8').strip() == source_hash:
+                logger.info("Skipping %s: output is up to date", book_name)
+                return True
 
         # Create output directory if it doesn't exist
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save to JSON file
-        output_file = output_dir / f"{book_name}.json"
+        # Save to JSON file, serializing one chapter at a time
+        total_verses = 0
+
+        with open(output_file, 'wb') as f:
+            f.write(header)
+            for index, chapter in enumerate(chapters):
+                converted_chapter = _convert_chapter(chapter)
+                total_verses += len(converted_chapter["verses"])
+                f.write(b",\n" if index else b"\n")
+                f.write(_indent_json(dump_json_bytes(converted_chapter), b"    "))
+            f.write(b"\n  ]\n}")
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        hash_file.write_text(source_hash, encoding='utf-8')
 
         # Log statistics
-        total_verses = sum(len(ch.get('verses', [])) for ch in converted_chapters)
-        logger.info(f"Converted {book_name}: {len(converted_chapters)} chapters, {total_verses} verses")
+        logger.info("Converted %s: %d chapters, %d verses", book_name, len(chapters), total_verses)
 
         return True
 
     except Exception as e:
-        logger.error(f"Error converting book {book_data.get('book_name', 'unknown')}: {e}")
+        logger.error("Error converting book %s: %s", book_data.get('book_name', 'unknown'), e)
         return False
 
 
 def convert_books_to_json(
     books_data: Dict[str, Dict[str, Any]],
     output_dir: str = "data/delitzsch",
-    dry_run: bool = False
+    dry_run: bool = False,
+    max_workers: Optional[int] = None
 ) -> Dict[str, bool]:
     """
     Convert multiple books to JSON format.
 
+    Books are independent, so they are serialized and written concurrently.
+
     Args:
         books_data: Dictionary mapping book names to parsed book data
         output_dir: Directory to save JSON files
         dry_run: If True, don't actually write files
+        max_workers: Number of worker threads (None for executor default)
 
     Returns:
         Dictionary mapping book names to conversion success status
@@ -108,21 +246,34 @@ def convert_books_to_json(
     if dry_run:
         logger.info("DRY RUN: Would process the following books:")
         for book_name in books_data.keys():
-            logger.info(f"  - {book_name}")
+            logger.info("  - %s", book_name)
         return {book_name: True for book_name in books_data.keys()}
 
-    for book_name, book_data in books_data.items():
-        logger.info(f"Converting book: {book_name}")
-        success = convert_book_to_json(book_data, output_path)
-        results[book_name] = success
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for book_name, book_data in books_data.items():
+            logger.info("Converting book: %s", book_name)
+            futures[executor.submit(convert_book_to_json, book_data, output_path)] = book_name
+
+        for future in as_completed(futures):
+            book_name = futures[future]
+            try:
+                success = future.result()
+            except Exception as e:
+                logger.error("Conversion worker failed for %s: %s", book_name, e)
+                success = False
+            results[book_name] = success
+
+            if not success:
+                logger.error("Failed to convert book: %s", book_name)
 
-        if not success:
-            logger.error(f"Failed to convert book: {book_name}")
+    # Report results in the order the books were requested
+    results = {book_name: results[book_name] for book_name in books_data}
 
     # Summary
     successful = sum(results.values())
     total = len(results)
-    logger.info(f"Conversion complete: {successful}/{total} books successful")
+    logger.info("Conversion complete: %d/%d books successful", successful, total)
 
     return results
 
@@ -142,45 +293,44 @@ def validate_converted_book(book_name: str, output_dir: str = "data/delitzsch")
         json_file = Path(output_dir) / f"{book_name}.json"
 
         if not json_file.exists():
-            logger.error(f"JSON file not found: {json_file}")
+            logger.error("JSON file not found: %s", json_file)
             return False
 
         # Load and validate JSON structure
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_bytes(json_file.read_bytes())
 
         # Check required fields
         required_fields = ['book_name', 'author', 'publication_year', 'chapters']
         for field in required_fields:
             if field not in data:
-                logger.error(f"Missing required field '{field}' in {book_name}.json")
+                logger.error("Missing required field '%s' in %s.json", field, book_name)
                 return False
 
         # Validate chapters structure
         chapters = data.get('chapters', [])
         if not chapters:
-            logger.error(f"No chapters found in {book_name}.json")
+            logger.error("No chapters found in %s.json", book_name)
             return False
 
         for i, chapter in enumerate(chapters):
             if 'number' not in chapter or 'verses' not in chapter:
-                logger.error(f"Invalid chapter structure at index {i} in {book_name}.json")
+                logger.error("Invalid chapter structure at index %d in %s.json", i, book_name)
                 return False
 
             verses = chapter.get('verses', [])
             for j, verse in enumerate(verses):
                 if 'number' not in verse or 'text_nikud' not in verse:
-                    logger.error(f"Invalid verse structure at chapter {i+1}, verse {j} in {book_name}.json")
+                    logger.error("Invalid verse structure at chapter %d, verse %d in %s.json", i + 1, j, book_name)
                     return False
 
-        logger.info(f"Validation passed for {book_name}.json")
+        logger.info("Validation passed for %s.json", book_name)
         return True
 
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {book_name}.json: {e}")
+        logger.error("Invalid JSON in %s.json: %s", book_name, e)
         return False
     except Exception as e:
-        logger.error(f"Error validating {book_name}.json: {e}")
+        logger.error("Error validating %s.json: %s", book_name, e)
         return False
 
 
@@ -200,12 +350,15 @@ def validate_all_converted_books(
     """
     results = {}
 
-    for book_name in book_names:
-        results[book_name] = validate_converted_book(book_name, output_dir)
+    if book_names:
+        # Each file is validated independently; validation is I/O-bound
+        with ThreadPoolExecutor(max_workers=min(32, len(book_names))) as executor:
+            outcomes = executor.map(validate_converted_book, book_names, repeat(output_dir))
+            results = dict(zip(book_names, outcomes))
 
     # Summary
     successful = sum(results.values())
     total = len(results)
-    logger.info(f"Validation complete: {successful}/{total} books passed validation")
+    logger.info("Validation complete: %d/%d books passed validation", successful, total)
 
     return results
\ No newline at end of file
@@ -2,14 +2,22 @@
 Repository downloading and HTML file location for Delitzsch Hebrew New Testament extractor.
 """
 
+import json
 import logging
+import os
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     requests = None
@@ -17,12 +25,19 @@ except ImportError:
 
 from .constants import (
     REPOSITORY_URL,
+    REPOSITORY_BRANCH,
+    RAW_CONTENT_BASE_URL,
     DEFAULT_REPO_DIR,
     HTML_DIR,
-    HTML_PATTERNS,
+    HTML_EXTENSIONS,
     REPO_TIMEOUT,
-    NEW_TESTAMENT_BOOKS,
+    DOWNLOAD_WORKERS,
+    DOWNLOAD_CHUNK_SIZE,
+    HTTP_CACHE_FILENAME,
+    NEW_TESTAMENT_BOOK_KEYS,
+    NEW_TESTAMENT_BOOK_LIST,
     HTML_FILENAME_MAPPING,
+    REVERSE_HTML_MAPPING,
 )
 
 logger = logging.getLogger(__name__)
@@ -62,28 +77,126 @@ def is_repository_valid(repo_path: Path) -> bool:
     if not git_dir.exists() or not git_dir.is_dir():
         return False
 
-    # Check if it's actually a git repository by running git status
+    # A git directory always has a HEAD holding either a symbolic ref or a
+    # detached commit SHA; checking it in-process avoids spawning git
+    head_file = git_dir / "HEAD"
+    try:
+        head = head_file.read_bytes().strip()
+    except OSError:
+        return False
+    return head.startswith(b"ref:") or len(head) in (40, 64)
+
+
+def get_remote_head(repo_url: str = REPOSITORY_URL, branch: str = REPOSITORY_BRANCH, timeout: int = 30) -> Optional[str]:
+    """
+    Get the commit SHA of a remote branch without cloning.
+
+    Args:
+        repo_url: URL of the repository
+        branch: Branch to inspect
+        timeout: Timeout in seconds for the ls-remote operation
+
+    Returns:
+        Commit SHA, or None if it could not be determined
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", repo_url, f"refs/heads/{branch}"],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+
+        if result.returncode != 0 or not result.stdout.strip():
+            logger.debug(f"Could not read remote head: {result.stderr}")
+            return None
+
+        return result.stdout.split()[0]
+
+    except (subprocess.SubprocessError, OSError) as e:
+        # OSError covers git missing from PATH
+        logger.debug(f"Could not read remote head: {e}")
+        return None
+
+
+def get_local_head(repo_path: Path) -> Optional[str]:
+    """
+    Get the commit SHA checked out in a local repository.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        Commit SHA, or None if it could not be determined
+    """
     try:
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "rev-parse", "HEAD"],
             cwd=repo_path,
             capture_output=True,
             text=True,
             timeout=10
         )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-        return False
+        return result.stdout.strip() if result.returncode == 0 else None
+    except (subprocess.SubprocessError, OSError):
+        return None
 
 
-def clone_repository(repo_url: str, repo_path: Path, timeout: int = REPO_TIMEOUT) -> bool:
+def _probe_repository(repo_path: Path) -> Optional[str]:
+    """
+    Query a local repository's work tree, git directory and HEAD in one call.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        Commit SHA of HEAD if repo_path is the top of its own work tree,
+        None otherwise
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--is-inside-work-tree", "--git-dir", "HEAD"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+    lines = result.stdout.split()
+    if result.returncode != 0 or len(lines) != 3:
+        return None
+
+    inside_work_tree, git_dir, head = lines
+    # A git dir other than ".git" means repo_path is nested in another repository
+    if inside_work_tree != "true" or git_dir != ".git":
+        return None
+    return head
+
+
+def clone_repository(
+    repo_url: str,
+    repo_path: Path,
+    timeout: int = REPO_TIMEOUT,
+    branch: str = REPOSITORY_BRANCH,
+    shallow: bool = True
+) -> bool:
     """
     Clone a git repository to the specified path.
 
+    By default the clone is shallow and partial: only the tip commit of a
+    single branch is fetched and file contents are downloaded on demand, since
+    history is never needed. The working tree is a sparse checkout limited to
+    the HTML directory (plus top-level files), so only those blobs are fetched
+    and written to disk.
+
     Args:
         repo_url: URL of the repository to clone
         repo_path: Local path where to clone the repository
         timeout: Timeout in seconds for the clone operation
+        branch: Branch to clone
+        shallow: Use a shallow, partial clone (False for full history)
 
     Returns:
         True if clone successful, False otherwise
@@ -95,8 +208,29 @@ def clone_repository(repo_url: str, repo_path: Path, timeout: int = REPO_TIMEOUT
         logger.info(f"Cloning repository from {repo_url} to {repo_path}")
 
         # Clone the repository
+        # Never recurse into submodules; --jobs bounds parallel fetches if one is added later
+        clone_args = [
+            "git", "clone", "--sparse", "--branch", branch,
+            "--no-recurse-submodules", f"--jobs={os.cpu_count() or 4}"
+        ]
+        if shallow:
+            clone_args += ["--depth=1", "--single-branch", "--filter=blob:none"]
+
         result = subprocess.run(
-            ["git", "clone", repo_url, str(repo_path)],
+            clone_args + [repo_url, str(repo_path)],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+
+        if result.returncode != 0:
+            logger.error(f"Failed to clone repository: {result.stderr}")
+            return False
+
+        # Check out only the HTML directory
+        result = subprocess.run(
+            ["git", "sparse-checkout", "set", HTML_DIR],
+            cwd=repo_path,
             capture_output=True,
             text=True,
             timeout=timeout
@@ -106,7 +240,7 @@ def clone_repository(repo_url: str, repo_path: Path, timeout: int = REPO_TIMEOUT
             logger.info("Repository cloned successfully")
             return True
         else:
-            logger.error(f"Failed to clone repository: {result.stderr}")
+            logger.error(f"Failed to check out {HTML_DIR}/: {result.stderr}")
             return False
 
     except subprocess.TimeoutExpired:
@@ -117,13 +251,24 @@ def clone_repository(repo_url: str, repo_path: Path, timeout: int = REPO_TIMEOUT
         return False
 
 
-def update_repository(repo_path: Path, timeout: int = 30) -> bool:
+def update_repository(
+    repo_path: Path,
+    timeout: int = 30,
+    branch: str = REPOSITORY_BRANCH,
+    shallow: bool = True
+) -> bool:
     """
-    Update an existing repository by pulling latest changes.
+    Update an existing repository to the latest commit of a branch.
+
+    Fetches only the branch tip and hard-resets the working tree to it, so a
+    cached shallow clone is refreshed without re-downloading or unshallowing
+    the repository.
 
     Args:
         repo_path: Path to the repository
-        timeout: Timeout in seconds for the pull operation
+        timeout: Timeout in seconds for each git operation
+        branch: Branch to fetch
+        shallow: Fetch only the branch tip (False to fetch full history)
 
     Returns:
         True if update successful, False otherwise
@@ -131,9 +276,23 @@ def update_repository(repo_path: Path, timeout: int = 30) -> bool:
     try:
         logger.info(f"Updating repository at {repo_path}")
 
-        # Pull latest changes
+        # Fetch latest branch tip
+        fetch_args = ["git", "fetch"] + (["--depth=1"] if shallow else []) + ["origin", branch]
         result = subprocess.run(
-            ["git", "pull"],
+            fetch_args,
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+
+        if result.returncode != 0:
+            logger.warning(f"Failed to fetch repository: {result.stderr}")
+            return False
+
+        # Move working tree to the fetched commit
+        result = subprocess.run(
+            ["git", "reset", "--hard", "FETCH_HEAD"],
             cwd=repo_path,
             capture_output=True,
             text=True,
@@ -155,11 +314,40 @@ def update_repository(repo_path: Path, timeout: int = 30) -> bool:
         return False
 
 
+def _discard_directory(path: Path) -> None:
+    """
+    Remove a directory tree without waiting for the deletion.
+
+    The tree is renamed aside (a single metadata operation) and deleted in a
+    background thread, so a re-clone into the same path can start right away.
+    The thread is not a daemon: the interpreter finishes the deletion before exit.
+
+    Args:
+        path: Directory to remove
+    """
+    trash = path.with_name(f"{path.name}.trash.{os.getpid()}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # Rename not possible (e.g. a leftover trash directory); delete in place
+        shutil.rmtree(path)
+        return
+
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(trash,),
+        kwargs={"ignore_errors": True},
+        name=f"rmtree-{path.name}"
+    ).start()
+
+
 def ensure_repository(
     repo_url: str = REPOSITORY_URL,
     repo_path: Optional[Path] = None,
     force_clone: bool = False,
-    update_existing: bool = True
+    update_existing: bool = True,
+    shallow: bool = True,
+    remote_head: Optional[str] = None
 ) -> Optional[Path]:
     """
     Ensure the repository is available locally.
@@ -169,6 +357,9 @@ def ensure_repository(
         repo_path: Local path for the repository (default: DEFAULT_REPO_DIR)
         force_clone: Force re-clone even if repository exists
         update_existing: Update existing repository with latest changes
+        shallow: Use a shallow, partial clone and shallow fetches
+        remote_head: Known upstream commit SHA; an existing repository already
+            at this commit is not updated
 
     Returns:
         Path to the repository if successful, None otherwise
@@ -187,14 +378,17 @@ def ensure_repository(
         if is_repository_valid(repo_path):
             logger.info(f"Repository already exists at {repo_path}")
             if update_existing:
-                update_repository(repo_path)
+                if remote_head and _probe_repository(repo_path) == remote_head:
+                    logger.info(f"Repository is already at upstream commit {remote_head[:12]}")
+                else:
+                    update_repository(repo_path, shallow=shallow)
             return repo_path
         else:
             logger.warning(f"Repository at {repo_path} is invalid, will re-clone")
             # Remove invalid repository before cloning
             logger.info(f"Removing invalid repository: {repo_path}")
             try:
-                shutil.rmtree(repo_path)
+                _discard_directory(repo_path)
             except Exception as e:
                 logger.error(f"Failed to remove invalid repository: {e}")
                 return None
@@ -203,18 +397,42 @@ def ensure_repository(
     if force_clone and repo_path.exists():
         logger.info(f"Removing existing repository for force clone: {repo_path}")
         try:
-            shutil.rmtree(repo_path)
+            _discard_directory(repo_path)
         except Exception as e:
             logger.error(f"Failed to remove existing repository: {e}")
             return None
 
     # Clone the repository
-    if clone_repository(repo_url, repo_path):
+    if clone_repository(repo_url, repo_path, shallow=shallow):
         return repo_path
     else:
         return None
 
 
+def _scan_html(directory: Path) -> List[Path]:
+    """
+    List the HTML files directly inside a directory.
+
+    os.scandir entries cache their file type, so no extra stat() is needed per entry.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        HTML file paths sorted by name (empty if the directory does not exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name for entry in entries
+                if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(HTML_EXTENSIONS)
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    return [directory / name for name in names]
+
+
 def find_html_files(repo_path: Path) -> List[Path]:
     """
     Find all HTML files in the repository.
@@ -225,34 +443,172 @@ def find_html_files(repo_path: Path) -> List[Path]:
     Returns:
         List of HTML file paths
     """
-    html_files = []
+    # HTML files live in the html directory; also check the root directory.
+    # dict.fromkeys drops duplicates while keeping scan order.
+    html_files = list(dict.fromkeys(_scan_html(repo_path / HTML_DIR) + _scan_html(repo_path)))
 
-    # Check if html directory exists
-    html_dir = repo_path / HTML_DIR
-    if html_dir.exists() and html_dir.is_dir():
-        # Find HTML files in the html directory
-        for pattern in HTML_PATTERNS:
-            html_files.extend(html_dir.glob(pattern))
+    logger.info(f"Found {len(html_files)} HTML files in repository")
+    return html_files
 
-    # Also check root directory for HTML files
-    for pattern in HTML_PATTERNS:
-        html_files.extend(repo_path.glob(pattern))
 
-    # Remove duplicates and sort
-    html_files = list(set(html_files))
-    html_files.sort()
+def _create_session(pool_size: int = DOWNLOAD_WORKERS) -> "requests.Session":
+    """
+    Create an HTTP session whose pooled connections are shared by all download workers.
 
-    logger.info(f"Found {len(html_files)} HTML files in repository")
-    return html_files
+    Connections are kept alive across books, and every content encoding urllib3
+    can decode here (gzip/deflate, plus br/zstd when brotli/zstandard are
+    installed) is advertised so the HTML is transferred compressed.
+
+    Args:
+        pool_size: Maximum number of pooled connections (one per worker)
+
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _load_http_cache(cache_file: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Load the ETag/Last-Modified validators recorded for downloaded files.
+
+    Args:
+        cache_file: Path to the cache file
+
+    Returns:
+        Dictionary mapping HTML filenames to their response validators
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable download cache {cache_file}: {e}")
+        return {}
 
 
-def download_html_files_directly(output_dir: Path, books: Optional[List[str]] = None) -> List[Path]:
+def _save_http_cache(cache_file: Path, cache: Dict[str, Dict[str, str]]) -> None:
+    """
+    Atomically save the ETag/Last-Modified validators for downloaded files.
+
+    Args:
+        cache_file: Path to the cache file
+        cache: Dictionary mapping HTML filenames to their response validators
+    """
+    tmp_file = cache_file.with_suffix('.tmp')
+    try:
+        tmp_file.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.warning(f"Could not save download cache {cache_file}: {e}")
+
+
+def _download_html_file(
+    session: "requests.Session",
+    book: str,
+    base_url: str,
+    output_dir: Path,
+    validators: Optional[Dict[str, str]] = None
+) -> Tuple[Optional[Path], Optional[Dict[str, str]]]:
+    """
+    Download the HTML file for a single book.
+
+    When validators from a previous download are given and the file is still
+    on disk, a conditional GET is sent and an HTTP 304 keeps the local copy.
+
+    Args:
+        session: Shared HTTP session
+        book: Book name to download
+        base_url: Base URL of the raw HTML directory
+        output_dir: Directory to save the HTML file
+        validators: ETag/Last-Modified recorded for the file on the previous download
+
+    Returns:
+        Tuple of (path to the file or None if the download failed,
+        validators to record for the file or None)
+    """
+    # Use the HTML filename mapping to get the correct filename
+    html_name = HTML_FILENAME_MAPPING.get(book, book)
+    html_filename = f"{html_name}.html"
+    url = f"{base_url}/{html_filename}"
+    output_file = output_dir / html_filename
+
+    headers = {}
+    if validators and output_file.exists():
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    try:
+        logger.debug(f"Downloading {html_filename} for book '{book}'...")
+        # Stream the raw bytes straight to disk (GitHub serves the files as UTF-8)
+        with session.get(url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 304:
+                logger.debug(f"{html_filename} is unchanged, keeping local copy")
+                return output_file, validators
+            elif response.status_code == 200:
+                # Write to a temporary file so an interrupted download never
+                # leaves a truncated file behind a still-valid cache entry
+                tmp_file = output_file.with_suffix('.part')
+                with open(tmp_file, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                tmp_file.replace(output_file)
+                logger.debug(f"Downloaded {html_filename}")
+
+                new_validators = {
+                    key: value for key, value in (
+                        ('etag', response.headers.get('ETag')),
+                        ('last_modified', response.headers.get('Last-Modified')),
+                    ) if value
+                }
+                return output_file, new_validators or None
+            else:
+                logger.warning(f"Failed to download {html_filename}: HTTP {response.status_code}")
+
+    except Exception as e:
+        logger.error(f"Error downloading {html_filename}: {e}")
+        logger.info(f"You can manually download from: {url}")
+        logger.info(f"And save to: {output_file}")
+
+    return None, None
+
+
+def download_html_files_directly(
+    output_dir: Path,
+    books: Optional[List[str]] = None,
+    max_workers: int = DOWNLOAD_WORKERS,
+    ref: str = REPOSITORY_BRANCH
+) -> List[Path]:
     """
     Download HTML files directly from GitHub raw content instead of cloning repository.
 
+    Downloads are network-bound, so books are fetched concurrently in a thread
+    pool sharing one session, which reuses TCP/TLS connections across files.
+    ETag/Last-Modified validators are kept in a cache file next to the HTML
+    so unchanged files are not transferred again on later runs.
+
     Args:
         output_dir: Directory to save HTML files
         books: List of book names to download (None for all New Testament books)
+        max_workers: Maximum number of concurrent downloads
+        ref: Branch or commit SHA to download from; a SHA pins every file to
+            that commit, which a possibly stale CDN copy of the branch does not
 
     Returns:
         List of downloaded HTML file paths
@@ -263,38 +619,39 @@ def download_html_files_directly(output_dir: Path, books: Optional[List[str]] =
         return []
 
     if books is None:
-        books = list(NEW_TESTAMENT_BOOKS.keys())
+        books = list(NEW_TESTAMENT_BOOK_LIST)
 
-    downloaded_files = []
-    base_url = "https://raw.githubusercontent.com/hebrew-bible/hebrew-bible.github.io/master/html"
+    base_url = f"{RAW_CONTENT_BASE_URL}/{ref}/html"
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    logger.info(f"Attempting to download {len(books)} HTML files...")
+    cache_file = output_dir / HTTP_CACHE_FILENAME
+    cache = _load_http_cache(cache_file)
+    html_filenames = [f"{HTML_FILENAME_MAPPING.get(book, book)}.html" for book in books]
 
-    for book in books:
-        # Use the HTML filename mapping to get the correct filename
-        html_name = HTML_FILENAME_MAPPING.get(book, book)
-        html_filename = f"{html_name}.html"
-        url = f"{base_url}/{html_filename}"
-        output_file = output_dir / html_filename
+    logger.info(f"Attempting to download {len(books)} HTML files...")
 
-        try:
-            logger.info(f"Downloading {html_filename} for book '{book}'...")
-            response = requests.get(url, timeout=30)
+    # executor.map keeps the downloaded files in requested book order
+    with _create_session(max_workers) as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            _download_html_file,
+            repeat(session),
+            books,
+            repeat(base_url),
+            repeat(output_dir),
+            (cache.get(html_filename) for html_filename in html_filenames)
+        ))
 
-            if response.status_code == 200:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(response.text)
-                downloaded_files.append(output_file)
-                logger.debug(f"Downloaded {html_filename}")
-            else:
-                logger.warning(f"Failed to download {html_filename}: HTTP {response.status_code}")
+    downloaded_files = []
+    for html_filename, (output_file, validators) in zip(html_filenames, results):
+        if output_file:
+            downloaded_files.append(output_file)
+        if validators:
+            cache[html_filename] = validators
+        else:
+            cache.pop(html_filename, None)
 
-        except Exception as e:
-            logger.error(f"Error downloading {html_filename}: {e}")
-            logger.info(f"You can manually download from: {url}")
-            logger.info(f"And save to: {output_file}")
+    _save_http_cache(cache_file, cache)
 
     logger.info(f"Downloaded {len(downloaded_files)} HTML files")
     return downloaded_files
@@ -314,26 +671,22 @@ def locate_delitzsch_files(repo_path: Path, book_filter: Optional[List[str]] = N
     html_files = find_html_files(repo_path)
 
     # Filter to only New Testament books by default
-    if book_filter is None:
-        book_filter = list(NEW_TESTAMENT_BOOKS.keys())
-
-    # Create reverse mapping from HTML filename to book name
-    html_to_book = {filename: book for book, filename in HTML_FILENAME_MAPPING.items()}
+    wanted_books = NEW_TESTAMENT_BOOK_KEYS if book_filter is None else frozenset(book_filter)
 
     filtered_files = []
+    file_books = []
     for html_file in html_files:
-        html_name = html_file.stem.lower()  # filename without .html extension
-        if html_name in html_to_book:
-            book_name = html_to_book[html_name]
-            if book_name in book_filter:
-                filtered_files.append(html_file)
+        # Filename without .html extension
+        book_name = REVERSE_HTML_MAPPING.get(html_file.stem.lower())
+        if book_name in wanted_books:
+            filtered_files.append(html_file)
+            file_books.append(book_name)
 
     logger.info(f"Located {len(filtered_files)} New Testament HTML files out of {len(html_files)} total files")
 
     # Log the found files
-    for i, html_file in enumerate(filtered_files):
-        html_name = html_file.stem.lower()
-        book_name = html_to_book.get(html_name, "unknown")
-        logger.debug(f"New Testament file {i+1}: {html_file.relative_to(repo_path)} (book: {book_name})")
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, (html_file, book_name) in enumerate(zip(filtered_files, file_books)):
+            logger.debug(f"New Testament file {i+1}: {html_file.relative_to(repo_path)} (book: {book_name})")
 
     return filtered_files
\ No newline at end of file
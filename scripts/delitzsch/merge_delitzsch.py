@@ -8,51 +8,183 @@ containing the Hebrew text from Franz Delitzsch's translation.
 
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    ijson = None
+    HAS_IJSON = False
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
 def load_json_file(file_path: Path) -> Optional[Dict[str, Any]]:
-    """Load JSON file safely."""
+    """Load JSON file safely (read as bytes, with orjson when available)."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        return orjson.loads(content) if HAS_ORJSON else json.loads(content)
     except Exception as e:
         logger.error(f"Error loading {file_path}: {e}")
         return None
 
 
 def save_json_file(file_path: Path, data: Dict[str, Any]) -> bool:
-    """Save JSON file safely."""
+    """Save JSON file safely (written as bytes, with orjson when available, same 2-space layout)."""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if HAS_ORJSON:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        # Write to a temporary file and rename it into place, so a crash
+        # mid-write never leaves a truncated JSON file behind
+        tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         return True
     except Exception as e:
         logger.error(f"Error saving {file_path}: {e}")
         return False
 
 
-def create_delitzsch_lookup(delitzsch_data: Dict[str, Any]) -> Dict[tuple, str]:
+def _build_lookup(chapters: Iterable[Dict[str, Any]]) -> List[List[str]]:
+    """Fill a lookup[chapter_num][verse_num] -> text table from Delitzsch chapters."""
+    lookup: List[List[str]] = []
+
+    for chapter in chapters:
+        chapter_num = chapter.get('number')
+        if not isinstance(chapter_num, int) or chapter_num < 0:
+            continue
+        if chapter_num >= len(lookup):
+            lookup.extend([] for _ in range(chapter_num + 1 - len(lookup)))
+        verses = lookup[chapter_num]
+
+        for verse in chapter.get('verses', []):
+            verse_num = verse.get('number')
+            if not isinstance(verse_num, int) or verse_num < 0:
+                continue
+            if verse_num >= len(verses):
+                verses.extend([''] * (verse_num + 1 - len(verses)))
+            verses[verse_num] = verse.get('text_nikud', '')
+
+    return lookup
+
+
+def create_delitzsch_lookup(delitzsch_data: Dict[str, Any]) -> List[List[str]]:
+    """
+    Create a lookup table for Delitzsch verses.
+
+    Chapter and verse numbers are small dense integers, so the table is a
+    nested list indexed as lookup[chapter_num][verse_num]; gaps hold "".
+
+    Returns:
+        Nested list with lookup[chapter_num][verse_num] -> delitzsch_text
+    """
+    return _build_lookup(delitzsch_data.get('chapters', []))
+
+
+def load_delitzsch_lookup(file_path: Path) -> Optional[List[List[str]]]:
     """
-    Create a lookup dictionary for Delitzsch verses.
+    Load a Delitzsch JSON file straight into a verse lookup table.
+
+    With ijson installed the chapters are parsed one at a time, so the full
+    book dict is never held in memory alongside the lookup; otherwise the
+    file is loaded whole.
+
+    Args:
+        file_path: Path to Delitzsch JSON file (data/delitzsch/)
 
     Returns:
-        Dictionary with (chapter_num, verse_num) -> delitzsch_text mapping
+        Lookup table as returned by create_delitzsch_lookup, or None on error
+    """
+    if not HAS_IJSON:
+        delitzsch_data = load_json_file(file_path)
+        return create_delitzsch_lookup(delitzsch_data) if delitzsch_data else None
+
+    try:
+        with open(file_path, 'rb') as f:
+            return _build_lookup(ijson.items(f, 'chapters.item'))
+    except Exception as e:
+        logger.error(f"Error loading {file_path}: {e}")
+        return None
+
+
+def _index_or_default(items: List[Any], index: Any, default: Any) -> Any:
+    """Return items[index], or default for a missing or non-integer index."""
+    try:
+        return items[index] if index >= 0 else default
+    except (IndexError, TypeError):
+        return default
+
+
+def _apply_merge(
+    hutter_data: Dict[str, Any],
+    delitzsch_lookup: List[List[str]]
+) -> Tuple[int, int, List[Tuple[Any, Any]], bool]:
     """
-    lookup = {}
+    Set text_nikud_delitzsch on every verse of already-parsed Hutter data.
 
-    for chapter in delitzsch_data.get('chapters', []):
+    Works in place and does no I/O, so several merges into the same book
+    can be applied to one parsed dict and saved once.
+
+    Args:
+        hutter_data: Parsed Hutter book data (modified in place)
+        delitzsch_lookup: Lookup table from create_delitzsch_lookup
+
+    Returns:
+        Tuple of (merged verse count, total verse count,
+        (chapter, verse) pairs without Delitzsch text, whether any verse changed)
+    """
+    merged_count = 0
+    total_count = 0
+    changed = False
+    missing = []
+    add_missing = missing.append
+
+    for chapter in hutter_data.get('chapters', []):
         chapter_num = chapter.get('number')
-        for verse in chapter.get('verses', []):
+        chapter_lookup = _index_or_default(delitzsch_lookup, chapter_num, [])
+        verses = chapter.get('verses', [])
+        total_count += len(verses)
+
+        for verse in verses:
             verse_num = verse.get('number')
-            text = verse.get('text_nikud', '')
-            lookup[(chapter_num, verse_num)] = text
 
-    return lookup
+            # Look up Delitzsch text (inlined _index_or_default: this is the hot loop)
+            try:
+                delitzsch_text = chapter_lookup[verse_num] if verse_num >= 0 else ""
+            except (IndexError, TypeError):
+                delitzsch_text = ""
+
+            if delitzsch_text:
+                merged_count += 1
+            else:
+                add_missing((chapter_num, verse_num))
+                delitzsch_text = ""  # Empty string for missing verses
+
+            if verse.get('text_nikud_delitzsch') != delitzsch_text:
+                verse['text_nikud_delitzsch'] = delitzsch_text
+                changed = True
+
+    return merged_count, total_count, missing, changed
 
 
 def merge_delitzsch_into_hutter(hutter_file: Path, delitzsch_file: Path) -> bool:
@@ -66,52 +198,60 @@ def merge_delitzsch_into_hutter(hutter_file: Path, delitzsch_file: Path) -> bool
     Returns:
         True if merge successful, False otherwise
     """
-    # Load both files
+    # Load Hutter data and the Delitzsch verse lookup
     hutter_data = load_json_file(hutter_file)
-    delitzsch_data = load_json_file(delitzsch_file)
-
-    if not hutter_data or not delitzsch_data:
+    if not hutter_data:
         return False
 
-    # Create Delitzsch lookup
-    delitzsch_lookup = create_delitzsch_lookup(delitzsch_data)
+    delitzsch_lookup = load_delitzsch_lookup(delitzsch_file)
+    if delitzsch_lookup is None:
+        return False
 
     # Merge Delitzsch text into Hutter data
-    merged_count = 0
-    total_count = 0
+    merged_count, total_count, missing, changed = _apply_merge(hutter_data, delitzsch_lookup)
 
-    for chapter in hutter_data.get('chapters', []):
-        chapter_num = chapter.get('number')
-        for verse in chapter.get('verses', []):
-            total_count += 1
-            verse_num = verse.get('number')
+    # One warning per book rather than one per missing verse
+    if missing:
+        first = ", ".join(f"{ch}:{v}" for ch, v in missing[:3])
+        logger.warning(f"No Delitzsch text found for {len(missing)} verses in {hutter_file.name} (first: {first})")
 
-            # Look up Delitzsch text
-            delitzsch_text = delitzsch_lookup.get((chapter_num, verse_num))
-            if delitzsch_text:
-                verse['text_nikud_delitzsch'] = delitzsch_text
-                merged_count += 1
-            else:
-                logger.warning(f"No Delitzsch text found for {hutter_file.name} chapter {chapter_num} verse {verse_num}")
-                verse['text_nikud_delitzsch'] = ""  # Empty string for missing verses
+    book_name = hutter_data.get('book_name', 'unknown')
+
+    # Nothing to write when a previous run already merged the same text
+    if not changed:
+        logger.info(f"✅ {book_name} already up to date ({merged_count}/{total_count} verses)")
+        return True
 
     # Save merged data
     success = save_json_file(hutter_file, hutter_data)
 
     if success:
-        book_name = hutter_data.get('book_name', 'unknown')
         logger.info(f"✅ Merged {merged_count}/{total_count} verses for {book_name}")
 
     return success
 
 
-def merge_all_books(output_dir: Path = Path("output"), delitzsch_dir: Path = Path("data/delitzsch")) -> None:
+def _merge_pair(files: Tuple[Path, Path]) -> bool:
+    """Merge one (Hutter file, Delitzsch file) pair (process pool worker)."""
+    hutter_file, delitzsch_file = files
+    return merge_delitzsch_into_hutter(hutter_file, delitzsch_file)
+
+
+def merge_all_books(
+    output_dir: Path = Path("output"),
+    delitzsch_dir: Path = Path("data/delitzsch"),
+    max_workers: Optional[int] = None
+) -> None:
     """
     Merge Delitzsch text into all available Hutter books.
 
+    Books are independent and JSON load/dump is CPU-bound, so they are merged
+    in a process pool.
+
     Args:
         output_dir: Directory containing Hutter JSON files
         delitzsch_dir: Directory containing Delitzsch JSON files
+        max_workers: Number of worker processes (None for CPU count)
     """
     if not output_dir.exists():
         logger.error(f"Output directory not found: {output_dir}")
@@ -138,23 +278,27 @@ def merge_all_books(output_dir: Path = Path("output"), delitzsch_dir: Path = Pat
 
     logger.info(f"Found {len(output_files)} output files and {len(delitzsch_files)} Delitzsch files")
 
-    # Process each output file
-    successful = 0
-    total = 0
-
+    # Pair each output file with its Delitzsch file
+    tasks = []
+    unmatched = []
     for output_file in output_files:
         book_name = output_file.stem
-        total += 1
 
         # Find corresponding Delitzsch file
         delitzsch_file = delitzsch_by_name.get(book_name)
         if not delitzsch_file:
-            logger.warning(f"No Delitzsch file found for book: {book_name}")
+            unmatched.append(book_name)
             continue
 
-        # Merge the files
-        if merge_delitzsch_into_hutter(output_file, delitzsch_file):
-            successful += 1
+        tasks.append((output_file, delitzsch_file))
+
+    if unmatched:
+        logger.warning(f"No Delitzsch file found for {len(unmatched)} books: {', '.join(sorted(unmatched))}")
+
+    # Merge the files
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        successful = sum(executor.map(_merge_pair, tasks))
+    total = len(output_files)
 
     logger.info(f"🎉 Merge complete: {successful}/{total} books successfully merged")
 
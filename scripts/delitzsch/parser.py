@@ -2,70 +2,275 @@
 HTML parsing and extraction logic for Delitzsch Hebrew New Testament.
 """
 
+import hashlib
+import json
 import logging
-import re
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 try:
-    from bs4 import BeautifulSoup
-    HAS_BEAUTIFULSOUP = True
+    from lxml import etree
+    HAS_LXML = True
 except ImportError:
-    BeautifulSoup = None
-    HAS_BEAUTIFULSOUP = False
+    etree = None
+    HAS_LXML = False
 
-from .constants import DEFAULT_ENCODING, NEW_TESTAMENT_BOOKS, HTML_FILENAME_MAPPING
+from .constants import DEFAULT_ENCODING, NEW_TESTAMENT_BOOKS, PARSE_CACHE_DIR, REVERSE_HTML_MAPPING
 
 logger = logging.getLogger(__name__)
 
 
-class DelitzschParser:
-    """Parser for Delitzsch Hebrew New Testament HTML files."""
+def _has_class(name: str) -> str:
+    """Return an XPath predicate matching elements carrying a CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath selectors used while walking the Delitzsch HTML tables
+TEXT_XPATH = "string()"
+TITLE_TEXT_XPATH = "string(//title)"
+BOOK_HEADINGS_XPATH = "//h1 | //h2 | //h3"
+CHAPTER_ANCHOR_XPATH = ".//a[@name]"
+VERSE_ROW_XPATH = f".//tr[{_has_class('break')}]"
+# string() of a node-set is the text of its first node ("" when empty), so
+# these return the cell text directly without building element lists
+HEBREW_TEXT_XPATH = f"string(.//p[{_has_class('heb')}])"
+VERSE_NUMBER_XPATH = f"string(.//p[{_has_class('versenum')}])"
+
+@lru_cache(maxsize=None)
+def get_xpath(expression: str):
+    """
+    Compile an XPath expression once and reuse it.
+
+    Args:
+        expression: XPath expression
+
+    Returns:
+        Compiled lxml XPath object
+    """
+    return etree.XPath(expression)
+
+
+def text_content(element) -> str:
+    """Return the concatenated text of an element and its descendants."""
+    return get_xpath(TEXT_XPATH)(element)
+
+
+# (book key, lowercased display name) pairs matched against titles and headings
+BOOK_NAMES_LOWER = tuple((book_key, book_name.lower()) for book_key, book_name in NEW_TESTAMENT_BOOKS.items())
+
+def match_book_name(text: str) -> Optional[str]:
+    """
+    Find the first book whose key or display name occurs in lowercased text.
+
+    Args:
+        text: Lowercased title or heading text
+
+    Returns:
+        Book key, or None if no book is named
+    """
+    return next(
+        (book_key for book_key, book_name in BOOK_NAMES_LOWER if book_key in text or book_name in text),
+        None
+    )
+
+
+# Hebrew numeral letters for units and tens
+HEBREW_ONES = ('', 'א', 'ב', 'ג', 'ד', 'ה', 'ו', 'ז', 'ח', 'ט')
+HEBREW_TENS = ('', 'י', 'כ', 'ל', 'מ', 'נ', 'ס', 'ע', 'פ', 'צ')
+
+
+def number_to_hebrew_numeral(number: int) -> str:
+    """
+    Convert a chapter number (1-100) to a Hebrew numeral.
+
+    15 and 16 are written טו and טז rather than יה and יו, which would
+    spell the divine name.
+
+    Args:
+        number: Number to convert
+
+    Returns:
+        Hebrew numeral string, or the decimal string outside 1-100
+    """
+    if number == 100:
+        return 'ק'
+    if not 0 < number < 100:
+        return str(number)
+    if number in (15, 16):
+        return 'ט' + HEBREW_ONES[number - 9]
+
+    tens, ones = divmod(number, 10)
+    return HEBREW_TENS[tens] + HEBREW_ONES[ones]
+
+
+# Bump whenever parsing changes its output, so older cache entries are ignored
+PARSER_VERSION = 2
+
+
+def _parse_cache_file(html_file: Path, cache_dir: Path) -> Path:
+    """Return the cache file holding the parsed data of an HTML file."""
+    digest = hashlib.sha1(str(html_file.absolute()).encode('utf-8')).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def load_cached_parse(
+    html_file: Path,
+    cache_key: List[int],
+    cache_dir: Path = PARSE_CACHE_DIR
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the cached parse of an HTML file if it is still valid.
+
+    Args:
+        html_file: Path to the HTML file
+        cache_key: [mtime_ns, size, PARSER_VERSION] of the file being parsed
+        cache_dir: Directory holding cached parses
+
+    Returns:
+        Parsed book data, or None on a cache miss
+    """
+    try:
+        entry = json.loads(_parse_cache_file(html_file, cache_dir).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get('key') != cache_key:
+        return None
+
+    book_data = entry.get('data')
+    if not isinstance(book_data, dict):
+        return None
+
+    book_data['source_file'] = str(html_file)
+    return book_data
+
+
+def save_cached_parse(
+    html_file: Path,
+    cache_key: List[int],
+    book_data: Dict[str, Any],
+    cache_dir: Path = PARSE_CACHE_DIR
+) -> None:
+    """
+    Store the parse of an HTML file, replacing the cache file atomically.
+
+    Args:
+        html_file: Path to the HTML file
+        cache_key: [mtime_ns, size, PARSER_VERSION] of the parsed file
+        book_data: Parsed book data
+        cache_dir: Directory holding cached parses
+    """
+    cache_file = _parse_cache_file(html_file, cache_dir)
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(json.dumps({'key': cache_key, 'data': book_data}, ensure_ascii=False).encode('utf-8'))
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.debug(f"Could not cache parse of {html_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+
+
+# Elements counted and collected by explore_html_structure
+HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+COUNTED_TAGS = ('div', 'p', 'span')
+
+
+class _StructureCollector:
+    """
+    lxml parser target gathering explore_html_structure statistics.
+
+    Receives the parser's start/end/data events directly, so no element
+    tree is built for the document.
+    """
 
     def __init__(self):
-        """Initialize the parser."""
-        self.has_bs4 = HAS_BEAUTIFULSOUP
-        if not HAS_BEAUTIFULSOUP:
-            logger.warning("BeautifulSoup4 not available - limited functionality")
+        self.title: Optional[str] = None
+        self.headings: List[str] = []
+        self.counts = dict.fromkeys(COUNTED_TAGS, 0)
+        self._title_parts: Optional[List[str]] = None
+        # (index into headings, text parts) for each heading still open
+        self._open_headings: List[Tuple[int, List[str]]] = []
+
+    def start(self, tag, attrib):
+        if tag in self.counts:
+            self.counts[tag] += 1
+        if tag in HEADING_TAGS:
+            self.headings.append('')
+            self._open_headings.append((len(self.headings) - 1, []))
+        elif tag == 'title' and self.title is None and self._title_parts is None:
+            self._title_parts = []
+
+    def end(self, tag):
+        if tag in HEADING_TAGS and self._open_headings:
+            index, parts = self._open_headings.pop()
+            self.headings[index] = ''.join(parts).strip()
+        elif tag == 'title' and self._title_parts is not None and self.title is None:
+            self.title = ''.join(self._title_parts)
+
+    def data(self, data):
+        for _, parts in self._open_headings:
+            parts.append(data)
+        if self._title_parts is not None and self.title is None:
+            self._title_parts.append(data)
+
+    def close(self):
+        return self
 
-        # Common Hebrew text patterns
-        self.hebrew_text_pattern = re.compile(r'[\u0590-\u05FF\u2000-\u206F]+')
 
-        # Verse number patterns (may need adjustment based on actual HTML)
-        self.verse_number_pattern = re.compile(r'^(\d+)\.?\s*')
+class DelitzschParser:
+    """Parser for Delitzsch Hebrew New Testament HTML files."""
 
-        # Chapter header patterns (may need adjustment)
-        self.chapter_header_pattern = re.compile(r'(?:chapter|פרק)\s*(\d+)', re.IGNORECASE)
+    # Stateless apart from the lxml flag; one instance is created per worker task
+    __slots__ = ('has_lxml',)
 
-    def parse_html_file(self, html_file: Path) -> Optional[Dict[str, Any]]:
+    def __init__(self):
+        """Initialize the parser."""
+        self.has_lxml = HAS_LXML
+        if not HAS_LXML:
+            logger.warning("lxml not available - limited functionality")
+
+    def parse_html_file(self, html_file: Path, no_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Parse a single HTML file and extract book data.
 
+        Successful parses are cached on disk (PARSE_CACHE_DIR) and reused
+        while the file's modification time and size are unchanged.
+
         Args:
             html_file: Path to the HTML file
+            no_cache: Always parse the HTML, ignoring and not updating the cache
 
         Returns:
             Dictionary containing parsed book data, or None if parsing failed
         """
-        if not self.has_bs4:
-            logger.error("BeautifulSoup4 required for HTML parsing")
+        if not self.has_lxml:
+            logger.error("lxml required for HTML parsing")
             return None
 
         try:
-            logger.debug(f"Parsing HTML file: {html_file}")
-
-            # Read HTML content
-            with open(html_file, 'r', encoding=DEFAULT_ENCODING) as f:
-                html_content = f.read()
+            cache_key = None
+            if not no_cache:
+                stat = html_file.stat()
+                cache_key = [stat.st_mtime_ns, stat.st_size, PARSER_VERSION]
+                book_data = load_cached_parse(html_file, cache_key)
+                if book_data:
+                    logger.info(f"Loaded cached parse of {html_file.name}: {len(book_data.get('chapters', []))} chapters")
+                    return book_data
 
-            # Parse HTML
-            soup = BeautifulSoup(html_content, 'lxml')
+            logger.debug(f"Parsing HTML file: {html_file}")
 
             # Extract book information
-            book_data = self._extract_book_data(soup, html_file)
+            book_data = self._extract_book_data(html_file)
 
             if book_data:
                 logger.info(f"Successfully parsed {html_file.name}: {len(book_data.get('chapters', []))} chapters")
+                if cache_key:
+                    save_cached_parse(html_file, cache_key, book_data)
                 return book_data
             else:
                 logger.warning(f"No book data found in {html_file.name}")
@@ -75,25 +280,32 @@ class DelitzschParser:
             logger.error(f"Error parsing HTML file {html_file}: {e}")
             return None
 
-    def _extract_book_data(self, soup: BeautifulSoup, html_file: Path) -> Optional[Dict[str, Any]]:
+    def _extract_book_data(self, html_file: Path) -> Optional[Dict[str, Any]]:
         """
-        Extract book data from parsed HTML.
+        Extract book data from an HTML file.
 
         Args:
-            soup: BeautifulSoup object
             html_file: Path to the HTML file
 
         Returns:
             Dictionary with book data or None
         """
-        # Try to determine book name from filename or content
-        book_name = self._determine_book_name(html_file, soup)
+        # The filename identifies the book in the common case; the document's
+        # title and headings are only kept when it does not
+        book_name = self._book_name_from_filename(html_file)
+
+        # Stream the document, extracting verses as each chapter table closes
+        tree, chapter_verses = self._stream_chapter_verses(html_file, keep_headings=book_name is None)
+
+        # Fall back to the document content
+        if not book_name:
+            book_name = self._book_name_from_content(tree)
         if not book_name:
             logger.warning(f"Could not determine book name for {html_file.name}")
             return None
 
         # Extract chapters
-        chapters = self._extract_chapters(soup)
+        chapters = self._extract_chapters(chapter_verses)
 
         if not chapters:
             logger.warning(f"No chapters found in {html_file.name}")
@@ -105,67 +317,68 @@ class DelitzschParser:
             'source_file': str(html_file)
         }
 
-    def _determine_book_name(self, html_file: Path, soup: BeautifulSoup) -> Optional[str]:
+    def _book_name_from_filename(self, html_file: Path) -> Optional[str]:
         """
-        Determine the book name from filename or HTML content.
+        Determine the book name from the HTML filename alone.
 
         Args:
             html_file: Path to the HTML file
-            soup: BeautifulSoup object
 
         Returns:
             Book name in lowercase format, or None
         """
         filename = html_file.stem.lower()
 
-        # Create reverse mapping from HTML filename to book name
-        html_to_book = {html_name: book for book, html_name in HTML_FILENAME_MAPPING.items()}
-
         # Try direct filename mapping first
-        if filename in html_to_book:
-            return html_to_book[filename]
+        if filename in REVERSE_HTML_MAPPING:
+            return REVERSE_HTML_MAPPING[filename]
 
         # Fallback: Try to match filename against known book names
-        for book_key in NEW_TESTAMENT_BOOKS.keys():
-            if book_key in filename:
-                return book_key
+        return next((book_key for book_key in NEW_TESTAMENT_BOOKS if book_key in filename), None)
+
+    def _book_name_from_content(self, tree) -> Optional[str]:
+        """
+        Determine the book name from the document title, then its headings.
 
-        # Try to extract from title or headings
-        title = soup.find('title')
-        if title and title.text:
-            title_text = title.text.lower()
-            for book_key, book_name in NEW_TESTAMENT_BOOKS.items():
-                if book_key in title_text or book_name.lower() in title_text:
-                    return book_key
+        The heading scan only runs when the title does not name a book.
+
+        Args:
+            tree: Root lxml element of the document
+
+        Returns:
+            Book name in lowercase format, or None
+        """
+        # Try to extract from title (text of the first <title>, "" if none)
+        title_text = get_xpath(TITLE_TEXT_XPATH)(tree)
+        book_key = match_book_name(title_text.lower()) if title_text else None
+        if book_key:
+            return book_key
 
         # Try to find book name in headings
-        for heading in soup.find_all(['h1', 'h2', 'h3']):
-            heading_text = heading.get_text().lower().strip()
-            for book_key, book_name in NEW_TESTAMENT_BOOKS.items():
-                if book_key in heading_text or book_name.lower() in heading_text:
-                    return book_key
+        for heading in get_xpath(BOOK_HEADINGS_XPATH)(tree):
+            book_key = match_book_name(text_content(heading).lower().strip())
+            if book_key:
+                return book_key
 
-        logger.debug(f"Could not determine book name from {filename}")
         return None
 
-    def _extract_chapters(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_chapters(self, chapter_verses: List[Tuple[int, List[Tuple[int, str]]]]) -> List[Dict[str, Any]]:
         """
-        Extract chapters from the HTML content.
+        Build chapter entries from the verses streamed out of the HTML.
+
+        Verses travel as (number, text) tuples while the document is streamed;
+        the output dictionaries are only built here, once per kept chapter.
 
         Args:
-            soup: BeautifulSoup object
+            chapter_verses: List of tuples (chapter_number, [(verse_number, hebrew_text), ...])
 
         Returns:
             List of chapter dictionaries
         """
         chapters = []
 
-        # Get chapter elements with their actual numbers
-        chapter_elements = self._find_chapter_elements(soup)
-
-        for chapter_num, chapter_element in chapter_elements:
-            verses = self._extract_verses_from_chapter(chapter_element)
-
+        # Sort by chapter number
+        for chapter_num, verses in sorted(chapter_verses, key=lambda x: x[0]):
             if verses:
                 # Convert chapter number to Hebrew numeral
                 hebrew_letter = self._number_to_hebrew_numeral(chapter_num)
@@ -173,94 +386,121 @@ class DelitzschParser:
                 chapters.append({
                     'hebrew_letter': hebrew_letter,
                     'number': chapter_num,
-                    'verses': verses
+                    'verses': [
+                        {'number': verse_num, 'text_nikud': hebrew_text}
+                        for verse_num, hebrew_text in verses
+                    ]
                 })
 
         return chapters
 
-    def _find_chapter_elements(self, soup: BeautifulSoup) -> List[Tuple[int, Any]]:
+    def _stream_chapter_verses(
+        self,
+        html_file: Path,
+        keep_headings: bool = True
+    ) -> Tuple[Any, List[Tuple[int, List[Tuple[int, str]]]]]:
         """
-        Find HTML elements that contain chapter content.
+        Incrementally parse an HTML file and extract the verses of each chapter.
+
+        Only chapter headings and tables are inspected. A chapter belongs to
+        the first table that opens after its heading, even when a nested table
+        inside it closes first. Each chapter table is consumed as soon as it is
+        closed and then cleared, so the verse rows never accumulate in memory;
+        the rest of the document (title, headings) is kept for book name
+        detection.
 
         Args:
-            soup: BeautifulSoup object
+            html_file: Path to the HTML file
+            keep_headings: Keep h2 headings in the returned tree (False clears
+                them once read, when the book name is already known)
 
         Returns:
-            List of tuples (chapter_number, element) containing chapter content
+            Tuple of (root element, list of (chapter_number, [(verse_number, hebrew_text), ...]) tuples)
         """
         chapters = []
-
-        # Look for h2 elements containing "Chapter"
-        for h2 in soup.find_all('h2'):
-            text = h2.get_text().strip()
-            if 'Chapter' in text or 'פרק' in text:
-                # Extract chapter number from <a name="X"> tag
-                anchor = h2.find('a', attrs={'name': True})
-                if anchor and anchor.get('name'):
-                    try:
-                        chapter_num = int(anchor.get('name'))
-                        # Find the table that follows this h2
-                        table = h2.find_next('table')
-                        if table:
-                            chapters.append((chapter_num, table))
-                    except ValueError:
-                        continue
-
-        # Sort by chapter number
-        chapters.sort(key=lambda x: x[0])
-
-        return chapters
-
-    def _extract_verses_from_chapter(self, chapter_element) -> List[Dict[str, Any]]:
+        pending_chapters = []
+        # Chapter tables that have opened but not yet closed
+        open_tables = {}
+
+        context = etree.iterparse(
+            str(html_file),
+            events=('start', 'end'),
+            tag=('h2', 'table'),
+            html=True,
+            encoding=DEFAULT_ENCODING,
+            # No id lookups or comments are needed, so skip indexing and storing them
+            collect_ids=False,
+            remove_comments=True
+        )
+
+        for event, element in context:
+            if event == 'start':
+                if element.tag == 'table' and pending_chapters:
+                    # The first table that follows a chapter heading holds its verses
+                    open_tables[element] = pending_chapters
+                    pending_chapters = []
+            elif element.tag == 'h2':
+                # Look for h2 elements containing "Chapter"
+                text = text_content(element).strip()
+                if 'Chapter' in text or 'פרק' in text:
+                    # Extract chapter number from <a name="X"> tag
+                    anchors = get_xpath(CHAPTER_ANCHOR_XPATH)(element)
+                    if anchors and anchors[0].get('name'):
+                        try:
+                            pending_chapters.append(int(anchors[0].get('name')))
+                        except ValueError:
+                            pass
+                if not keep_headings:
+                    element.clear(keep_tail=True)
+            elif element in open_tables:
+                verses = list(self._iter_verses(element))
+                chapters.extend((chapter_num, verses) for chapter_num in open_tables.pop(element))
+                # A chapter table nested in another one is still part of its rows
+                if not open_tables:
+                    element.clear(keep_tail=True)
+
+        return context.root, chapters
+
+    def _iter_verses(self, chapter_element) -> Iterator[Tuple[int, str]]:
         """
-        Extract verses from a chapter element (table).
+        Yield the verses of a chapter table in document order.
 
         Args:
-            chapter_element: BeautifulSoup table element containing chapter verses
+            chapter_element: lxml table element containing chapter verses
 
-        Returns:
-            List of verse dictionaries
+        Yields:
+            Tuples of (verse_number, hebrew_text)
         """
-        verses = []
+        hebrew_text_xpath = get_xpath(HEBREW_TEXT_XPATH)
+        verse_number_xpath = get_xpath(VERSE_NUMBER_XPATH)
 
         # Find all table rows with class="break"
-        rows = chapter_element.find_all('tr', class_='break')
+        rows = get_xpath(VERSE_ROW_XPATH)(chapter_element)
 
         for row in rows:
-            # Get all table cells
-            cells = row.find_all('td')
-            if len(cells) >= 3:
-                # First cell: Hebrew text
-                hebrew_cell = cells[0]
-                hebrew_text_elem = hebrew_cell.find('p', class_='heb')
-                if hebrew_text_elem:
-                    hebrew_text = self._clean_hebrew_text(hebrew_text_elem.get_text())
-                else:
-                    continue
-
-                # Find verse number - it could be in column 2 (3-column table) or column 3 (4-column table)
-                verse_num = None
-                for cell in cells[1:]:  # Check cells after the Hebrew text cell
-                    verse_num_elem = cell.find('p', class_='versenum')
-                    if verse_num_elem:
-                        verse_num_text = verse_num_elem.get_text().strip()
-                        try:
-                            verse_num = int(verse_num_text)
-                            break  # Found it, stop looking
-                        except ValueError:
-                            continue
-
-                if verse_num is None:
-                    continue
-
-                # Add verse if we have both text and number
-                if hebrew_text and verse_num:
-                    verses.append({
-                        'number': verse_num,
-                        'text_nikud': hebrew_text
-                    })
-
-        return verses
+            # Get all table cells in one C-level walk of the row
+            cells = list(row.iter('td'))
+            if len(cells) < 3:
+                continue
+
+            # First cell: Hebrew text
+            hebrew_text = self._clean_hebrew_text(hebrew_text_xpath(cells[0]))
+            if not hebrew_text:
+                continue
+
+            # Find verse number - it could be in column 2 (3-column table) or column 3 (4-column table)
+            # (isdecimal() only accepts digit strings, which int() always parses,
+            # so cells without a number are skipped without raising ValueError)
+            verse_num = None
+            for cell in cells[1:]:  # Check cells after the Hebrew text cell
+                verse_num_text = verse_number_xpath(cell).strip()
+                if verse_num_text.isdecimal():
+                    verse_num = int(verse_num_text)
+                    break  # Found it, stop looking
+
+            # Keep the verse if we have both text and a non-zero number
+            if verse_num:
+                yield verse_num, hebrew_text
 
     def _clean_hebrew_text(self, text: str) -> str:
         """
@@ -275,17 +515,10 @@ class DelitzschParser:
         if not text:
             return ""
 
-        # Remove newlines and extra whitespace
-        text = text.replace('\n', ' ')
-
-        # Replace multiple spaces with single space
-        import re
-        text = re.sub(r'\s+', ' ', text)
-
-        # Strip leading/trailing whitespace
-        text = text.strip()
-
-        return text
+        # Collapse newlines and runs of whitespace to single spaces, then trim.
+        # str.split() splits on the same characters as the regex \s and runs
+        # entirely in C, several times faster than re.sub for this job.
+        return ' '.join(text.split())
 
     def _number_to_hebrew_numeral(self, number: int) -> str:
         """
@@ -297,21 +530,7 @@ class DelitzschParser:
         Returns:
             Hebrew numeral string
         """
-        # Hebrew numerals mapping (extended for all reasonable chapter numbers)
-        hebrew_numerals = {
-            1: 'א', 2: 'ב', 3: 'ג', 4: 'ד', 5: 'ה', 6: 'ו', 7: 'ז', 8: 'ח', 9: 'ט', 10: 'י',
-            11: 'יא', 12: 'יב', 13: 'יג', 14: 'יד', 15: 'טו', 16: 'טז', 17: 'יז', 18: 'יח', 19: 'יט', 20: 'כ',
-            21: 'כא', 22: 'כב', 23: 'כג', 24: 'כד', 25: 'כה', 26: 'כו', 27: 'כז', 28: 'כח', 29: 'כט', 30: 'ל',
-            31: 'לא', 32: 'לב', 33: 'לג', 34: 'לד', 35: 'לה', 36: 'לו', 37: 'לז', 38: 'לח', 39: 'לט', 40: 'מ',
-            41: 'מא', 42: 'מב', 43: 'מג', 44: 'מד', 45: 'מה', 46: 'מו', 47: 'מז', 48: 'מח', 49: 'מט', 50: 'נ',
-            51: 'נא', 52: 'נב', 53: 'נג', 54: 'נד', 55: 'נה', 56: 'נו', 57: 'נז', 58: 'נח', 59: 'נט', 60: 'ס',
-            61: 'סא', 62: 'סב', 63: 'סג', 64: 'סד', 65: 'סה', 66: 'סו', 67: 'סז', 68: 'סח', 69: 'סט', 70: 'ע',
-            71: 'עא', 72: 'עב', 73: 'עג', 74: 'עד', 75: 'עה', 76: 'עו', 77: 'עז', 78: 'עח', 79: 'עט', 80: 'פ',
-            81: 'פא', 82: 'פב', 83: 'פג', 84: 'פד', 85: 'פה', 86: 'פו', 87: 'פז', 88: 'פח', 89: 'פט', 90: 'צ',
-            91: 'צא', 92: 'צב', 93: 'צג', 94: 'צד', 95: 'צה', 96: 'צו', 97: 'צז', 98: 'צח', 99: 'צט', 100: 'ק'
-        }
-
-        return hebrew_numerals.get(number, str(number))
+        return number_to_hebrew_numeral(number)
 
     def explore_html_structure(self, html_file: Path) -> Dict[str, Any]:
         """
@@ -323,24 +542,33 @@ class DelitzschParser:
         Returns:
             Dictionary with structural analysis
         """
-        if not self.has_bs4:
-            return {'error': 'BeautifulSoup4 required for HTML exploration'}
+        if not self.has_lxml:
+            return {'error': 'lxml required for HTML exploration'}
 
         try:
-            with open(html_file, 'r', encoding=DEFAULT_ENCODING) as f:
-                html_content = f.read()
+            # lxml decodes the raw bytes itself; only the sample is decoded here
+            html_bytes = html_file.read_bytes()
 
-            soup = BeautifulSoup(html_content, 'lxml')
+            # Collect the statistics from parser events in a single pass,
+            # without building a tree
+            collector = etree.fromstring(
+                html_bytes,
+                etree.HTMLParser(target=_StructureCollector(), encoding=DEFAULT_ENCODING)
+            )
 
             analysis = {
                 'file': str(html_file),
-                'title': soup.find('title').get_text() if soup.find('title') else None,
-                'headings': [h.get_text().strip() for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])],
-                'div_count': len(soup.find_all('div')),
-                'p_count': len(soup.find_all('p')),
-                'span_count': len(soup.find_all('span')),
-                'text_length': len(html_content),
-                'sample_text': html_content[:500] + '...' if len(html_content) > 500 else html_content
+                'title': collector.title,
+                'headings': collector.headings,
+                'div_count': collector.counts['div'],
+                'p_count': collector.counts['p'],
+                'span_count': collector.counts['span'],
+                'text_length': len(html_bytes),
+                # A multi-byte character cut at the 500-byte mark is dropped
+                'sample_text': (
+                    html_bytes[:500].decode(DEFAULT_ENCODING, errors='ignore') + '...'
+                    if len(html_bytes) > 500 else html_bytes.decode(DEFAULT_ENCODING)
+                )
             }
 
             return analysis
@@ -350,28 +578,75 @@ class DelitzschParser:
             return {'error': str(e)}
 
 
-def parse_html_files(html_files: List[Path], explore_only: bool = False) -> Dict[str, Dict[str, Any]]:
+def _parse_one(
+    html_file: Path,
+    explore_only: bool = False,
+    no_cache: bool = False
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Parse or explore a single HTML file (process pool worker).
+
+    Args:
+        html_file: Path to the HTML file
+        explore_only: If True, only explore structure without full parsing
+        no_cache: Bypass the on-disk parse cache
+
+    Returns:
+        Tuple of (result key, parsed data or None if parsing failed)
+    """
+    parser = DelitzschParser()
+
+    if explore_only:
+        analysis = parser.explore_html_structure(html_file)
+        return html_file.stem, {'analysis': analysis}  # Use filename as key for exploration
+
+    book_data = parser.parse_html_file(html_file, no_cache=no_cache)
+    if book_data:
+        return book_data['book_name'], book_data
+    return html_file.stem, None
+
+
+def parse_html_files(
+    html_files: List[Path],
+    explore_only: bool = False,
+    max_workers: Optional[int] = None,
+    no_cache: bool = False
+) -> Dict[str, Dict[str, Any]]:
     """
     Parse multiple HTML files.
 
+    Each book is an independent document, so files are parsed in a process
+    pool (parsing is CPU-bound and would otherwise serialize on the GIL).
+
     Args:
         html_files: List of HTML file paths
         explore_only: If True, only explore structure without full parsing
+        max_workers: Number of worker processes (None for CPU count, 1 to parse serially)
+        no_cache: Reparse every file instead of reusing cached parses
 
     Returns:
         Dictionary mapping book names to parsed data
     """
-    parser = DelitzschParser()
     results = {}
 
-    for html_file in html_files:
-        if explore_only:
-            analysis = parser.explore_html_structure(html_file)
-            book_name = html_file.stem  # Use filename as key for exploration
-            results[book_name] = {'analysis': analysis}
-        else:
-            book_data = parser.parse_html_file(html_file)
-            if book_data:
-                results[book_data['book_name']] = book_data
-
-    return results
\ No newline at end of file
+    if max_workers == 1 or len(html_files) <= 1:
+        for html_file in html_files:
+            key, data = _parse_one(html_file, explore_only, no_cache)
+            if data:
+                results[key] = data
+        return results
+
+    # Never start more workers than there are files, and hand each worker a
+    # few files per round trip to cut pickling/IPC overhead
+    workers = min(max_workers or os.cpu_count() or 1, len(html_files))
+    chunksize = max(1, len(html_files) // (workers * 4))
+
+    # executor.map preserves input order, so results match the serial path
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for key, data in executor.map(
+            _parse_one, html_files, repeat(explore_only), repeat(no_cache), chunksize=chunksize
+        ):
+            if data:
+                results[key] = data
+
+    return results
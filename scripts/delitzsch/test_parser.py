@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the streaming Delitzsch HTML parser.
+
+Run with: python -m pytest scripts/delitzsch/test_parser.py
+"""
+
+from pathlib import Path
+
+from scripts.delitzsch.parser import DelitzschParser
+
+# Chapter 1's table has a table nested inside a verse cell, which closes
+# before the chapter table itself does
+NESTED_TABLE_HTML = """<html><head><title>Matthew</title></head><body>
+<h2><a name="1"></a>Chapter 1</h2>
+<table>
+<tr class="break"><td><p class="heb">בְּרֵאשִׁית</p></td><td></td><td><p class="versenum">1</p></td></tr>
+<tr class="break"><td><p class="heb">וְהָאָרֶץ</p><table><tr><td>note</td></tr></table></td><td></td><td><p class="versenum">2</p></td></tr>
+</table>
+<h2><a name="2"></a>Chapter 2</h2>
+<table>
+<tr class="break"><td><p class="heb">וַיְהִי</p></td><td></td><td><p class="versenum">1</p></td></tr>
+</table>
+</body></html>
+"""
+
+
+def test_nested_table_keeps_chapter(tmp_path: Path):
+    html_file = tmp_path / "matthew.html"
+    html_file.write_text(NESTED_TABLE_HTML, encoding="utf-8")
+
+    book_data = DelitzschParser().parse_html_file(html_file, no_cache=True)
+
+    assert book_data is not None
+    assert [chapter['number'] for chapter in book_data['chapters']] == [1, 2]
+    assert [verse['number'] for verse in book_data['chapters'][0]['verses']] == [1, 2]
@@ -3,7 +3,17 @@
 import cv2
 import logging
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, Optional, List, Callable
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    HAS_NUMBA = False
+
 from .utils import (
     VERTICAL_WIDTH_RANGE,
     VERTICAL_MIN_HEIGHT,
@@ -15,6 +25,18 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Small closing applied after dilating text into column blobs
+CLOSING_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+
+@lru_cache(maxsize=32)
+def _rect_kernel(width: int, height: int) -> np.ndarray:
+    """Rectangular structuring element, built once per size.
+
+    Pages of one manuscript share a size, so every page reuses the same kernels.
+    """
+    return cv2.getStructuringElement(cv2.MORPH_RECT, (width, height))
+
 
 def select_second_column(
     candidates: List[Tuple], sort_key: Callable, get_coords: Callable, image_width: int = None
@@ -67,7 +89,7 @@ def select_second_column(
 
 
 def find_main_box_from_contours(
-    thresh: np.ndarray, margin: int = 20
+    thresh: np.ndarray, margin: int = 20, scale: int = 1
 ) -> Optional[Tuple[int, int, int, int]]:
     """
     Find the main vertical column using contour analysis.
@@ -75,6 +97,10 @@ def find_main_box_from_contours(
     Args:
         thresh: Binary image after thresholding.
         margin: Pixels to skip from borders to avoid noise.
+        scale: Run the morphology and contour search on an image decimated
+            by this factor. Boxes are mapped back to full resolution, so
+            they are only accurate to about ``scale`` pixels and narrow
+            gutters between columns can close up; 1 keeps full resolution.
         
     Returns:
         Bounding box (x, y, w, h) or None if not found.
@@ -88,49 +114,64 @@ def find_main_box_from_contours(
     # Morphological operations to connect text
     h_kernel_size = max(3, int(width * 0.015))
     v_kernel_size = max(8, int(height * 0.008))
-    kernel_horizontal = cv2.getStructuringElement(cv2.MORPH_RECT, (h_kernel_size, 3))
-    kernel_vertical = cv2.getStructuringElement(cv2.MORPH_RECT, (3, v_kernel_size))
-    
-    dilated_h = cv2.dilate(roi, kernel_horizontal, iterations=2)
-    dilated = cv2.dilate(dilated_h, kernel_vertical, iterations=3)
+    # Dilating twice with (h, 3) and then three times with (3, v) is the same
+    # as one dilation with their Minkowski sum, a single rectangle. The anchor
+    # is the sum of the individual anchors so even kernel sizes line up too.
+    fused_kernel = _rect_kernel(2 * h_kernel_size + 5, 3 * v_kernel_size + 2)
+    fused_anchor = (2 * (h_kernel_size // 2) + 3, 3 * (v_kernel_size // 2) + 2)
+    if scale > 1:
+        # Any ink in a scale x scale cell marks the whole cell, which already
+        # grows every blob by up to scale - 1 pixels, so shrink the kernel
+        # by the same amount before mapping it to the small image.
+        small = cv2.resize(
+            roi,
+            (roi.shape[1] // scale, roi.shape[0] // scale),
+            interpolation=cv2.INTER_AREA,
+        )
+        _, small = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY)
+        small_kernel = _rect_kernel(
+            max(1, (fused_kernel.shape[1] - scale + 1) // scale),
+            max(1, (fused_kernel.shape[0] - scale + 1) // scale),
+        )
+        dilated = cv2.dilate(small, small_kernel)
+    else:
+        dilated = cv2.dilate(roi, fused_kernel, anchor=fused_anchor)
     
-    closing_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-    dilated = cv2.morphologyEx(dilated, cv2.MORPH_CLOSE, closing_kernel, iterations=1)
+    dilated = cv2.morphologyEx(dilated, cv2.MORPH_CLOSE, CLOSING_KERNEL, iterations=1)
     
     contours, _ = cv2.findContours(
         dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
     )
     
-    candidate_boxes: List[Tuple[Tuple[int, int, int, int], float]] = []
-    for cnt in contours:
-        x, y, w, h = cv2.boundingRect(cnt)
-        x += margin
-        y += margin
-        
-        # Width validation
-        max_allowed_width = min(VERTICAL_WIDTH_RANGE[1] + 200, int(width * 0.6))
-        width_ok = VERTICAL_WIDTH_RANGE[0] <= w <= max_allowed_width
-        # Height validation
-        height_ok = h >= max(VERTICAL_MIN_HEIGHT - 200, int(0.4 * height))
-        # Position validation - allow wide range to find ALL columns
-        center_x = x + w / 2
-        x_ok = (
-            x >= 0
-            and x <= width * 0.8
-            and center_x <= width * 0.8
-        )
-        # Aspect ratio validation
-        aspect_ok = h / max(1, w) > 1.5
-        
-        if width_ok and height_ok and x_ok and aspect_ok:
-            # Score by area and centrality
-            area = w * h
-            ideal_x = width * 0.3
-            centrality_score = 1.0 / (1.0 + abs(center_x - ideal_x) / (width * 0.2))
-            ideal_width = (VERTICAL_WIDTH_RANGE[0] + VERTICAL_WIDTH_RANGE[1]) / 2
-            width_score = 1.0 / (1.0 + abs(w - ideal_width) / 200)
-            score = area * centrality_score * width_score
-            candidate_boxes.append(((x, y, w, h), score))
+    # Validate and score all bounding boxes at once, one row per contour
+    boxes = np.array(
+        [cv2.boundingRect(cnt) for cnt in contours], dtype=np.int64
+    ).reshape(-1, 4) * scale
+    boxes[:, :2] += margin
+    xs, ys, ws, hs = boxes.T
+    
+    # Width validation
+    max_allowed_width = min(VERTICAL_WIDTH_RANGE[1] + 200, int(width * 0.6))
+    width_ok = (ws >= VERTICAL_WIDTH_RANGE[0]) & (ws <= max_allowed_width)
+    # Height validation
+    height_ok = hs >= max(VERTICAL_MIN_HEIGHT - 200, int(0.4 * height))
+    # Position validation - allow wide range to find ALL columns
+    center_xs = xs + ws / 2
+    x_ok = (xs >= 0) & (xs <= width * 0.8) & (center_xs <= width * 0.8)
+    # Aspect ratio validation
+    aspect_ok = hs / np.maximum(1, ws) > 1.5
+    
+    # Score by area and centrality
+    ideal_x = width * 0.3
+    centrality_scores = 1.0 / (1.0 + np.abs(center_xs - ideal_x) / (width * 0.2))
+    ideal_width = (VERTICAL_WIDTH_RANGE[0] + VERTICAL_WIDTH_RANGE[1]) / 2
+    width_scores = 1.0 / (1.0 + np.abs(ws - ideal_width) / 200)
+    scores = ws * hs * centrality_scores * width_scores
+    
+    valid = np.flatnonzero(width_ok & height_ok & x_ok & aspect_ok)
+    candidate_boxes: List[Tuple[Tuple[int, int, int, int], float]] = [
+        (tuple(int(v) for v in boxes[i]), float(scores[i])) for i in valid
+    ]
     
     if not candidate_boxes:
         return None
@@ -173,6 +214,12 @@ def find_main_box_from_contours(
     return box
 
 
+def _cluster_positions(sorted_xs: np.ndarray, gap: int) -> List[np.ndarray]:
+    """Group sorted positions into clusters split wherever two neighbours are gap or more apart."""
+    breaks = np.flatnonzero(np.diff(sorted_xs) >= gap) + 1
+    return np.split(sorted_xs, breaks)
+
+
 def find_main_box_with_hough(
     gray: np.ndarray, thresh: np.ndarray
 ) -> Optional[Tuple[int, int, int, int]]:
@@ -203,64 +250,48 @@ def find_main_box_with_hough(
     if lines is None:
         return None
     
-    vertical_xs: List[int] = []
-    horizontal_ys: List[int] = []
-    
-    for line in lines[:, 0, :]:
-        x1, y1, x2, y2 = line
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        
-        if dx < 15 and dy > 300:  # Vertical lines
-            avg_x = (x1 + x2) / 2
-            if 0 <= avg_x <= width * 0.8:
-                vertical_xs.extend([x1, x2])
-        
-        if dy < 15 and dx > 300:  # Horizontal lines
-            if 0 <= min(y1, y2) <= 700:  # TITLE_SCAN_HEIGHT + 300
-                horizontal_ys.extend([y1, y2])
+    # Classify every segment at once; reshape also covers OpenCV builds
+    # that return lines as (N, 4) rather than (N, 1, 4)
+    x1s, y1s, x2s, y2s = lines.reshape(-1, 4).astype(np.int64).T
+    dxs = np.abs(x2s - x1s)
+    dys = np.abs(y2s - y1s)
+    
+    # Vertical lines
+    avg_xs = (x1s + x2s) / 2
+    is_vertical = (dxs < 15) & (dys > 300) & (avg_xs >= 0) & (avg_xs <= width * 0.8)
+    vertical_xs = np.column_stack((x1s[is_vertical], x2s[is_vertical])).ravel()
+    
+    # Horizontal lines
+    top_ys = np.minimum(y1s, y2s)
+    is_horizontal = (
+        (dys < 15) & (dxs > 300) & (top_ys >= 0) & (top_ys <= 700)  # TITLE_SCAN_HEIGHT + 300
+    )
+    horizontal_ys = np.column_stack((y1s[is_horizontal], y2s[is_horizontal])).ravel()
     
-    if len(vertical_xs) < 2:
+    if vertical_xs.size < 2:
         return None
     
     # Filter and cluster x positions
-    filtered_xs = [x for x in vertical_xs if 0 <= x <= width * 0.8]
-    if len(filtered_xs) < 2:
+    filtered_xs = vertical_xs[(vertical_xs >= 0) & (vertical_xs <= width * 0.8)]
+    if filtered_xs.size < 2:
         return None
     
-    filtered_xs_sorted = sorted(filtered_xs)
-    clusters: List[List[int]] = []
-    if len(filtered_xs_sorted) == 0:
-        return None
+    filtered_xs_sorted = np.sort(filtered_xs)
     
-    current_cluster = [filtered_xs_sorted[0]]
-    for x in filtered_xs_sorted[1:]:
-        if x - current_cluster[-1] < 50:
-            current_cluster.append(x)
-        else:
-            clusters.append(current_cluster)
-            current_cluster = [x]
-    clusters.append(current_cluster)
+    clusters = _cluster_positions(filtered_xs_sorted, 50)
     
     # Retry with tighter clustering if needed
     if len(clusters) < 3 and len(filtered_xs_sorted) > 2:
-        clusters = []
-        current_cluster = [filtered_xs_sorted[0]]
-        for x in filtered_xs_sorted[1:]:
-            if x - current_cluster[-1] < 30:
-                current_cluster.append(x)
-            else:
-                clusters.append(current_cluster)
-                current_cluster = [x]
-        clusters.append(current_cluster)
+        clusters = _cluster_positions(filtered_xs_sorted, 30)
     
     # Find valid column pairs
     valid_columns: List[Tuple[int, int, float]] = []  # (left_x, right_x, score)
     
     for i in range(len(clusters) - 1):
         j = i + 1
-        left_x = min(clusters[i])
-        right_x = max(clusters[j])
+        # Clusters are slices of a sorted array
+        left_x = int(clusters[i][0])
+        right_x = int(clusters[j][-1])
         w = right_x - left_x
         
         if VERTICAL_WIDTH_RANGE[0] - 300 <= w <= VERTICAL_WIDTH_RANGE[1] + 400:
@@ -285,8 +316,8 @@ def find_main_box_with_hough(
             valid_columns.append((left_x, right_x, score))
     
     if not valid_columns:
-        left_x = min(filtered_xs)
-        right_x = max(filtered_xs)
+        left_x = int(filtered_xs_sorted[0])
+        right_x = int(filtered_xs_sorted[-1])
     else:
             # Select second column
             result = select_second_column(
@@ -339,16 +370,17 @@ def find_main_box_with_hough(
     
     # Find vertical extent
     y_min, y_max = 0, height - 1
-    if horizontal_ys:
-        y_min = max(0, min(horizontal_ys) - 20)
+    if horizontal_ys.size > 0:
+        y_min = max(0, int(horizontal_ys.min()) - 20)
     
     # Refine vertical range
     mask = thresh[:, max(0, left_x - 10) : min(width, right_x + 10)]
-    nz = cv2.findNonZero(mask)
-    if nz is not None and len(nz) > 0:
-        y_coords = nz[:, 0, 1]
-        y_min_refined = max(0, int(np.min(y_coords) - 15))
-        y_max_refined = min(height - 1, int(np.max(y_coords) + 15))
+    # Only the first and last inked rows matter, so reduce each row to a flag
+    # instead of listing every foreground pixel
+    ink_rows = np.flatnonzero(mask.any(axis=1))
+    if ink_rows.size > 0:
+        y_min_refined = max(0, int(ink_rows[0] - 15))
+        y_max_refined = min(height - 1, int(ink_rows[-1] + 15))
         y_min = min(y_min, y_min_refined)
         y_max = max(y_max, y_max_refined)
     
@@ -415,6 +447,62 @@ def find_main_box_with_hough(
     return box
 
 
+def _run_bounds(indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split sorted, non-empty indices into runs of consecutive values.
+
+    Returns:
+        Arrays of the first and last index of each run.
+    """
+    splits = np.flatnonzero(np.diff(indices) > 1)
+    starts = np.concatenate((indices[:1], indices[splits + 1]))
+    ends = np.concatenate((indices[splits], indices[-1:]))
+    return starts, ends
+
+
+def _score_runs(
+    prefix_sum: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    min_width: int,
+    max_width: int,
+    ideal_width: float,
+) -> np.ndarray:
+    """
+    Score projection runs whose width is plausible for a text column.
+    
+    Args:
+        prefix_sum: Cumulative column projection with a leading zero.
+        starts: First column of each run.
+        ends: Last column of each run.
+        min_width: Narrowest run to keep.
+        max_width: Widest run to keep.
+        ideal_width: Width that gets the best score.
+        
+    Returns:
+        Array of (x0, x1, w, score) rows for the kept runs.
+    """
+    scored = np.empty((starts.shape[0], 4))
+    count = 0
+    for i in range(starts.shape[0]):
+        x0 = starts[i]
+        x1 = ends[i] + 1
+        w = x1 - x0
+        if min_width <= w <= max_width:
+            density = prefix_sum[x1] - prefix_sum[x0]
+            width_score = 1.0 / (1.0 + abs(w - ideal_width) / 200)
+            position_score = 1.0 if x0 > 50 else 0.7
+            scored[count, 0] = x0
+            scored[count, 1] = x1
+            scored[count, 2] = w
+            scored[count, 3] = density * width_score * position_score
+            count += 1
+    return scored[:count]
+
+
+if HAS_NUMBA:
+    _score_runs = njit(cache=True)(_score_runs)
+
+
 def longest_run(array: np.ndarray, ratio: float = 0.02) -> Optional[Tuple[int, int, int]]:
     """Find the longest continuous run in an array above threshold."""
     if array.size == 0:
@@ -426,15 +514,10 @@ def longest_run(array: np.ndarray, ratio: float = 0.02) -> Optional[Tuple[int, i
     indices = np.where(array > threshold)[0]
     if indices.size == 0:
         return None
-    splits = np.where(np.diff(indices) > 1)[0]
-    starts = [indices[0]]
-    ends: List[int] = []
-    for idx in splits:
-        ends.append(indices[idx])
-        starts.append(indices[idx + 1])
-    ends.append(indices[-1])
-    spans = [(s, e, e - s) for s, e in zip(starts, ends)]
-    return max(spans, key=lambda t: t[2])
+    starts, ends = _run_bounds(indices)
+    spans = ends - starts
+    best = int(np.argmax(spans))
+    return starts[best], ends[best], spans[best]
 
 
 def find_main_box_from_projection(
@@ -453,8 +536,10 @@ def find_main_box_from_projection(
     if height == 0 or width == 0:
         return None
     
-    sum_x = thresh.sum(axis=0)
-    sum_y = thresh.sum(axis=1)
+    # int32 is plenty for a 255-valued mask and accumulates about twice as
+    # fast as numpy's default uint64 (and faster than cv2.reduce row sums)
+    sum_x = thresh.sum(axis=0, dtype=np.int32)
+    sum_y = thresh.sum(axis=1, dtype=np.int32)
     
     # Find all dense text regions (columns)
     all_columns: List[Tuple[int, int, int, float]] = []  # (x0, x1, w, score)
@@ -463,59 +548,52 @@ def find_main_box_from_projection(
     
     x_span = None  # Initialize before loop
     
+    # The thresholds only differ by ratio, so sort the projection once and
+    # find the columns above each threshold with a binary search.
+    threshold_ratios = [0.005, 0.01, 0.015, 0.02, 0.025, 0.03, 0.035, 0.04, 0.045, 0.05]
+    max_val = search_sum_x.max() if search_sum_x.size else 0
+    if max_val == 0:
+        threshold_ratios = []
+    order = np.argsort(search_sum_x, kind="stable")
+    sorted_sum_x = search_sum_x[order]
+    prefix_sum_x = np.concatenate(([0], np.cumsum(search_sum_x, dtype=np.int64)))
+    min_col_width = max(300, VERTICAL_WIDTH_RANGE[0] - 400)
+    max_col_width = min(VERTICAL_WIDTH_RANGE[1] + 500, int(width * 0.75))
+    ideal_width = (VERTICAL_WIDTH_RANGE[0] + VERTICAL_WIDTH_RANGE[1]) / 2
+    
     # Try multiple thresholds to find all valid columns
-    for threshold_ratio in [0.005, 0.01, 0.015, 0.02, 0.025, 0.03, 0.035, 0.04, 0.045, 0.05]:
-        if search_sum_x.size == 0:
-            continue
-        max_val = search_sum_x.max()
-        if max_val == 0:
-            continue
+    for threshold_ratio in threshold_ratios:
         threshold = max(1, threshold_ratio * float(max_val))
-        indices = np.where(search_sum_x > threshold)[0]
+        first_above = np.searchsorted(sorted_sum_x, threshold, side="right")
+        indices = np.sort(order[first_above:])
         if indices.size == 0:
             continue
         
-        splits = np.where(np.diff(indices) > 1)[0]
-        starts = [indices[0]]
-        ends = []
-        for idx in splits:
-            ends.append(indices[idx])
-            starts.append(indices[idx + 1])
-        ends.append(indices[-1])
+        starts, ends = _run_bounds(indices)
         
-        for start, end in zip(starts, ends):
-            x0_cand = start
-            x1_cand = end + 1
-            w_cand = x1_cand - x0_cand
-            
-            min_col_width = max(300, VERTICAL_WIDTH_RANGE[0] - 400)
-            max_col_width = min(VERTICAL_WIDTH_RANGE[1] + 500, int(width * 0.75))
-            if min_col_width <= w_cand <= max_col_width:
-                density = search_sum_x[x0_cand:x1_cand].sum()
-                ideal_width = (VERTICAL_WIDTH_RANGE[0] + VERTICAL_WIDTH_RANGE[1]) / 2
-                width_score = 1.0 / (1.0 + abs(w_cand - ideal_width) / 200)
-                position_score = 1.0 if x0_cand > 50 else 0.7
-                score = density * width_score * position_score
-                all_columns.append((x0_cand, x1_cand, w_cand, score))
+        scored = _score_runs(
+            prefix_sum_x, starts, ends, min_col_width, max_col_width, ideal_width
+        )
+        all_columns.extend(
+            (int(x0_cand), int(x1_cand), int(w_cand), float(score))
+            for x0_cand, x1_cand, w_cand, score in scored
+        )
         
-        # Remove overlapping columns
+        # Remove overlapping columns. Runs found at different thresholds are
+        # either nested or disjoint, so after sorting by x0 a candidate can
+        # only overlap the column kept just before it.
         filtered_columns = []
-        if all_columns:
-            all_columns.sort(key=lambda c: c[0])
-            for col in all_columns:
-                x0, x1, w, score = col
-                overlap = False
-                for existing in filtered_columns:
-                    ex0, ex1 = existing[0], existing[1]
-                    overlap_size = max(0, min(x1, ex1) - max(x0, ex0))
-                    if overlap_size > min(w, ex1 - ex0) * 0.3:
-                        overlap = True
-                        if score > existing[3]:
-                            filtered_columns.remove(existing)
-                            filtered_columns.append(col)
-                        break
-                if not overlap:
-                    filtered_columns.append(col)
+        all_columns.sort(key=lambda c: c[0])
+        for col in all_columns:
+            x0, x1, w, score = col
+            if filtered_columns:
+                ex0, ex1, _, ex_score = filtered_columns[-1]
+                overlap_size = max(0, min(x1, ex1) - max(x0, ex0))
+                if overlap_size > min(w, ex1 - ex0) * 0.3:
+                    if score > ex_score:
+                        filtered_columns[-1] = col
+                    continue
+            filtered_columns.append(col)
         
         if filtered_columns:
             filtered_columns.sort(key=lambda c: c[0])
@@ -3,9 +3,11 @@
 import cv2
 import logging
 import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
-from typing import Tuple, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from .detection import (
     find_main_box_from_contours,
@@ -31,20 +33,44 @@ from .logger import ImageLogger, log_summary
 
 logger = logging.getLogger(__name__)
 
+# Joins title glyphs into horizontal bands in _detect_title_region
+TITLE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 3))
+
+# Extractor shared by every image a worker process handles (see _init_worker)
+_worker_extractor: Optional["HebrewTextExtractor"] = None
+
+
+def _init_worker(extractor: "HebrewTextExtractor") -> None:
+    """Keep this process's copy of the extractor and limit OpenCV to one thread.
+
+    Images already run in parallel across processes, so OpenCV's own thread
+    pool would only oversubscribe the cores.
+    """
+    global _worker_extractor
+    cv2.setNumThreads(1)
+    _worker_extractor = extractor
+
+
+def _process_image_in_worker(image_path: Path) -> bool:
+    """Process one image with the extractor set up by _init_worker."""
+    return _worker_extractor.process_single_image(image_path, use_logger=True)
+
 
 class HebrewTextExtractor:
     """Class to handle dynamic Hebrew text extraction from images."""
 
-    def __init__(self, input_dir: Path, output_dir: Path):
+    def __init__(self, input_dir: Path, output_dir: Path, detection_scale: int = 1):
         """
         Initialize the extractor.
 
         Args:
             input_dir: Directory containing input images
             output_dir: Directory to save cropped images
+            detection_scale: Decimation factor for contour detection (1 = full resolution)
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
+        self.detection_scale = detection_scale
         # Special handling for john1: skip 000006.png and 000008.png,
         # and from 000009.png onwards, process only odd-numbered images
         self.is_john1 = "john1" in str(input_dir).lower()
@@ -136,12 +162,12 @@ class HebrewTextExtractor:
         Convert image to grayscale and adaptive-thresholded binary mask.
 
         Args:
-            image: Source BGR image.
+            image: Source BGR image, or its grayscale conversion.
 
         Returns:
             Tuple of (gray image, thresholded image).
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
         thresh = cv2.adaptiveThreshold(
             blurred,
@@ -686,8 +712,7 @@ class HebrewTextExtractor:
             return None
 
         # Emphasize horizontal structures
-        horiz_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 3))
-        closed = cv2.morphologyEx(roi, cv2.MORPH_CLOSE, horiz_kernel, iterations=2)
+        closed = cv2.morphologyEx(roi, cv2.MORPH_CLOSE, TITLE_KERNEL, iterations=2)
 
         contours, _ = cv2.findContours(
             closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
@@ -716,13 +741,20 @@ class HebrewTextExtractor:
         )
         return abs_box
 
-    def detect_hebrew_column(self, image: cv2.Mat, img_logger: Optional[ImageLogger] = None) -> Tuple[Tuple[int, int, int, int], str]:
+    def detect_hebrew_column(
+        self,
+        image: cv2.Mat,
+        img_logger: Optional[ImageLogger] = None,
+        preprocessed: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[Tuple[int, int, int, int], str]:
         """
         Dynamically detect the Hebrew text column using contours and line detection.
 
         Args:
             image: OpenCV image matrix
             img_logger: Optional ImageLogger for organized logging
+            preprocessed: Optional (gray, thresh) pair from _preprocess, reused
+                instead of thresholding the image again
 
         Returns:
             Tuple of ((x, y, w, h), method_used) where method_used is the detection method name
@@ -740,10 +772,12 @@ class HebrewTextExtractor:
                 "fallback",
             )
 
-        gray, thresh = self._preprocess(image)
+        if preprocessed is None:
+            preprocessed = self._preprocess(image)
+        gray, thresh = preprocessed
 
         # Try detection methods in order
-        box = find_main_box_from_contours(thresh)
+        box = find_main_box_from_contours(thresh, scale=self.detection_scale)
         method_used = "contour"
         if box is None:
             logger.debug("Contour detection failed; trying Hough lines.")
@@ -871,12 +905,12 @@ class HebrewTextExtractor:
         Check if an image is blank or has very little content.
 
         Args:
-            image: BGR image
+            image: BGR image, or its grayscale conversion
 
         Returns:
             True if image appears to be blank
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         std = np.std(gray)
         return std < 15
 
@@ -957,8 +991,11 @@ class HebrewTextExtractor:
                     image_logger.__exit__(None, None, None)
                 return False
 
+            # Grayscale once for the blank check and preprocessing
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
             # Check if image is blank
-            if self._is_image_blank(image):
+            if self._is_image_blank(gray):
                 if image_logger:
                     image_logger.log_info("Skipped: blank image")
                     image_logger.__exit__(None, None, None)
@@ -966,11 +1003,13 @@ class HebrewTextExtractor:
 
             height, width = image.shape[:2]
 
-            # Detect bounding box
-            (x, y, w, h), method_used = self.detect_hebrew_column(image, image_logger)
+            # Preprocess once (for detection, specific fixes and general adjustments)
+            gray, thresh = self._preprocess(gray)
 
-            # Preprocess once (for both specific fixes and general adjustments)
-            gray, thresh = self._preprocess(image)
+            # Detect bounding box
+            (x, y, w, h), method_used = self.detect_hebrew_column(
+                image, image_logger, preprocessed=(gray, thresh)
+            )
 
             # Apply specific fixes FIRST (BEFORE split check)
             # This preserves original coordinates for problematic images
@@ -1017,10 +1056,35 @@ class HebrewTextExtractor:
                 image_logger.__exit__(None, None, None)
             return False
 
-    def process_all_images(self) -> Tuple[int, int]:
+    def _iter_results(self, image_files: List[Path], workers: int) -> Iterator[bool]:
+        """
+        Process images and yield each result in input order.
+
+        Args:
+            image_files: Images to process
+            workers: Worker processes to use (1 processes them in this process)
+
+        Yields:
+            Result of process_single_image for each image
+        """
+        if workers <= 1:
+            for image_path in image_files:
+                yield self.process_single_image(image_path, use_logger=True)
+            return
+
+        # Every image is independent, so spread them over worker processes
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            yield from executor.map(_process_image_in_worker, image_files)
+
+    def process_all_images(self, jobs: Optional[int] = None) -> Tuple[int, int]:
         """
         Process all images in the input directory.
 
+        Args:
+            jobs: Worker processes to spread images over (None for CPU count)
+
         Returns:
             Tuple of (successful_count, total_count)
         """
@@ -1043,11 +1107,14 @@ class HebrewTextExtractor:
 
         logger.info(f"Found {len(image_files)} images to process in {self.input_dir}")
 
+        jobs = jobs or os.cpu_count() or 1
+        workers = min(jobs, len(image_files))
+
         successful = 0
         skipped = 0
         with tqdm(total=len(image_files), desc="Processing images", ncols=80) as pbar:
-            for image_path in image_files:
-                result = self.process_single_image(image_path, use_logger=True)
+            results = self._iter_results(image_files, workers)
+            for image_path, result in zip(image_files, results):
                 if result:
                     successful += 1
                 else:
@@ -81,7 +81,7 @@ def validate_books(book_names):
     return valid_books
 
 
-def process_book(book_name, input_base_dir, output_base_dir):
+def process_book(book_name, input_base_dir, output_base_dir, detection_scale=1, jobs=None):
     """
     Process a single book for Hebrew text extraction.
 
@@ -89,6 +89,8 @@ def process_book(book_name, input_base_dir, output_base_dir):
         book_name: Name of the book to process
         input_base_dir: Base directory containing raw images (e.g., data/images/raw_images)
         output_base_dir: Base directory for output (e.g., data/images/hebrew_images)
+        detection_scale: Decimation factor for contour detection (1 = full resolution)
+        jobs: Worker processes for image extraction (None for CPU count)
 
     Returns:
         bool: True if processing was successful, False otherwise
@@ -118,7 +120,7 @@ def process_book(book_name, input_base_dir, output_base_dir):
         
         if book_name.lower() == 'colossians':
             # Process all images normally, but exclude laodikim pages
-            extractor = HebrewTextExtractor(input_dir, output_dir)
+            extractor = HebrewTextExtractor(input_dir, output_dir, detection_scale)
             
             # Get all image files
             image_files = []
@@ -146,7 +148,7 @@ def process_book(book_name, input_base_dir, output_base_dir):
             logger.info(f"  Output: {laodikim_output_dir}")
             
             laodikim_images = [img for img in image_files if img.name in laodikim_pages]
-            laodikim_extractor = HebrewTextExtractor(input_dir, laodikim_output_dir)
+            laodikim_extractor = HebrewTextExtractor(input_dir, laodikim_output_dir, detection_scale)
             
             with tqdm(total=len(laodikim_images), desc="Processing laodikim", ncols=80) as pbar:
                 for image_path in laodikim_images:
@@ -156,8 +158,8 @@ def process_book(book_name, input_base_dir, output_base_dir):
             logger.info(f"Successfully processed {book_name} and Laodicea letter pages")
         else:
             # Normal processing for other books
-            extractor = HebrewTextExtractor(input_dir, output_dir)
-            extractor.process_all_images()
+            extractor = HebrewTextExtractor(input_dir, output_dir, detection_scale)
+            extractor.process_all_images(jobs=jobs)
             logger.info(f"Successfully processed {book_name}")
         return True
     except Exception as e:
@@ -165,7 +167,7 @@ def process_book(book_name, input_base_dir, output_base_dir):
         return False
 
 
-def process_books(book_names, input_base_dir, output_base_dir):
+def process_books(book_names, input_base_dir, output_base_dir, detection_scale=1, jobs=None):
     """
     Process multiple books for Hebrew text extraction.
 
@@ -173,6 +175,8 @@ def process_books(book_names, input_base_dir, output_base_dir):
         book_names: List of book names to process
         input_base_dir: Base directory containing raw images
         output_base_dir: Base directory for output
+        detection_scale: Decimation factor for contour detection (1 = full resolution)
+        jobs: Worker processes for image extraction (None for CPU count)
 
     Returns:
         bool: True if all books were processed successfully, False otherwise
@@ -183,7 +187,7 @@ def process_books(book_names, input_base_dir, output_base_dir):
     logger.info(f"Processing {total_books} books...")
 
     for book_name in book_names:
-        if process_book(book_name, input_base_dir, output_base_dir):
+        if process_book(book_name, input_base_dir, output_base_dir, detection_scale, jobs):
             success_count += 1
 
     logger.info(f"Completed: {success_count}/{total_books} books processed successfully")
@@ -191,6 +195,14 @@ def process_books(book_names, input_base_dir, output_base_dir):
     return success_count == total_books
 
 
+def positive_int(value):
+    """Parse a command-line value as an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract Hebrew text columns from images.",
@@ -224,6 +236,21 @@ Examples:
         help='Base directory for output (default: data/images/hebrew_images)'
     )
 
+    parser.add_argument(
+        '--detection-scale',
+        type=positive_int,
+        default=1,
+        help='Downsample factor for contour detection; faster but only accurate '
+             'to a few pixels (default: 1, full resolution)'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=positive_int,
+        default=None,
+        help='Worker processes for image extraction (default: CPU count)'
+    )
+
     parser.add_argument(
         '--list',
         action='store_true',
@@ -258,7 +285,9 @@ Examples:
     success = process_books(
         book_names=book_names,
         input_base_dir=args.input_dir,
-        output_base_dir=args.output_dir
+        output_base_dir=args.output_dir,
+        detection_scale=args.detection_scale,
+        jobs=args.jobs
     )
 
     if not success:
@@ -2,7 +2,7 @@
 PDF to Images Converter Package
 
 This package provides functionality to convert PDF pages to images
-for OCR processing using pdf2image library.
+for OCR processing using PDFium (pypdfium2) or the pdf2image library.
 """
 
 from scripts.images.constants import AVAILABLE_BOOKS, DEFAULT_DPI, DEFAULT_OUTPUT_DIR
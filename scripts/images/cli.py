@@ -8,10 +8,12 @@ from typing import List
 
 from scripts.images.constants import (
     AVAILABLE_BOOKS,
+    AVAILABLE_BOOKS_SET,
     DEFAULT_BATCH_SIZE,
     DEFAULT_DPI,
     DEFAULT_IMAGE_FORMAT,
     DEFAULT_OUTPUT_DIR,
+    DEFAULT_PNG_COMPRESS_LEVEL,
     PDF_SOURCE_DIR,
     SUPPORTED_FORMATS,
     TEST_OUTPUT_DIR,
@@ -97,10 +99,11 @@ def validate_books(book_names: List[str]) -> List[str]:
     valid_books = []
 
     for book in book_names:
-        if book.lower() == "all":
+        name = book.lower()
+        if name == "all":
             return AVAILABLE_BOOKS.copy()
-        elif book.lower() in AVAILABLE_BOOKS:
-            valid_books.append(book.lower())
+        elif name in AVAILABLE_BOOKS_SET:
+            valid_books.append(name)
         else:
             invalid_books.append(book)
 
@@ -115,7 +118,7 @@ def validate_books(book_names: List[str]) -> List[str]:
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
-        description="Convert PDF pages to images using pdf2image",
+        description="Convert PDF pages to images using PDFium (or pdf2image)",
         epilog="""
 Examples:
   python -m scripts.images --list                     # List all books
@@ -126,7 +129,10 @@ Examples:
   python -m scripts.images --pages 1-5 matthew        # Convert pages 1-5
   python -m scripts.images --dpi 150 matthew          # Custom DPI (150-200 for OCR)
   python -m scripts.images --format JPEG matthew      # JPEG format
-  python -m scripts.images --batch-size 20 matthew    # Process 20 pages at once
+  python -m scripts.images --format WEBP matthew      # Near-lossless WebP (fast to encode)
+  python -m scripts.images --png-compress-level 6 matthew  # Smaller PNGs for archiving
+  python -m scripts.images --batch-size 20 matthew    # Up to 20 pages per worker task
+  python -m scripts.images --jobs 4 matthew           # Use 4 CPU cores
   python -m scripts.images --check-integrity          # Check PDF integrity
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -177,6 +183,15 @@ Examples:
         help=f"Image format (default: {DEFAULT_IMAGE_FORMAT})",
     )
 
+    parser.add_argument(
+        "--png-compress-level",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_PNG_COMPRESS_LEVEL,
+        metavar="{0-9}",
+        help=f"zlib compression level for PNG output (default: {DEFAULT_PNG_COMPRESS_LEVEL}, fastest; use 6+ for archiving)",
+    )
+
     parser.add_argument(
         "--dpi",
         type=int,
@@ -188,7 +203,15 @@ Examples:
         "--batch-size",
         type=int,
         default=DEFAULT_BATCH_SIZE,
-        help=f"Number of pages to process at once (default: {DEFAULT_BATCH_SIZE})",
+        help=f"Maximum pages per worker task (default: {DEFAULT_BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="CPU cores to use for rendering and encoding (default: CPU count)",
     )
 
     parser.add_argument(
@@ -33,19 +33,42 @@ AVAILABLE_BOOKS = [
     "revelation",
 ]
 
+# Set form of AVAILABLE_BOOKS for membership checks
+AVAILABLE_BOOKS_SET = frozenset(AVAILABLE_BOOKS)
+
 # Default directories
 DEFAULT_OUTPUT_DIR = "data/images/raw_images"
 TEST_OUTPUT_DIR = "data/temp"
 PDF_SOURCE_DIR = "data/source"
 
-# Performance tracking file
-PERF_STATS_FILE = "data/.conversion_stats.json"
+# Performance tracking file (append-only JSON lines, last entry per key wins)
+PERF_STATS_FILE = "data/.conversion_stats.jsonl"
+LEGACY_PERF_STATS_FILE = "data/.conversion_stats.json"
+
+# Compact the stats log once it holds this many lines per distinct key
+PERF_STATS_COMPACT_RATIO = 10
+
+# Page count cache, keyed by PDF path, mtime and size
+PDFINFO_CACHE_FILE = "data/.pdfinfo_cache.json"
+
+# Bitmap of converted pages kept in each book's image directory
+CONVERTED_PAGES_SIDECAR = ".converted.bits"
 
 # Default conversion settings
 DEFAULT_DPI = 300
 DEFAULT_BATCH_SIZE = 10
 DEFAULT_IMAGE_FORMAT = "PNG"
 
+# zlib level for PNG output (1 = fastest; OCR doesn't benefit from smaller files)
+DEFAULT_PNG_COMPRESS_LEVEL = 1
+
+# Missing runs separated by at most this many converted pages are rendered
+# as one range (the converted pages in between are skipped, not re-rendered)
+DEFAULT_COALESCE_GAP = 4
+
 # Supported image formats
-SUPPORTED_FORMATS = ["PNG", "JPEG", "TIFF", "BMP"]
+SUPPORTED_FORMATS = ["PNG", "WEBP", "JPEG", "TIFF", "BMP"]
+
+# File extension of the pages saved in each format
+FORMAT_EXTENSIONS = {"PNG": "png", "WEBP": "webp", "JPEG": "jpg", "TIFF": "tiff", "BMP": "bmp"}
 
@@ -2,26 +2,54 @@
 PDF to Image conversion functionality.
 """
 
+import atexit
+import io
+import json
 import logging
+import math
 import os
+import queue
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
-from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
 from tqdm import tqdm
 
+try:
+    import pypdfium2 as pdfium
+
+    HAS_PYPDFIUM2 = True
+except ImportError:
+    pdfium = None
+    HAS_PYPDFIUM2 = False
+
+try:
+    from pdf2image import convert_from_path, pdfinfo_from_path
+
+    HAS_PDF2IMAGE = True
+except ImportError:
+    HAS_PDF2IMAGE = False
+
 from scripts.images.constants import (
     DEFAULT_BATCH_SIZE,
+    DEFAULT_COALESCE_GAP,
     DEFAULT_DPI,
     DEFAULT_IMAGE_FORMAT,
+    DEFAULT_PNG_COMPRESS_LEVEL,
+    FORMAT_EXTENSIONS,
     PDF_SOURCE_DIR,
+    PDFINFO_CACHE_FILE,
 )
 from scripts.images.stats import (
     estimate_conversion_time,
     update_performance_stats,
 )
 from scripts.images.utils import (
+    ConvertedPagesSidecar,
     check_pdf_integrity,
     format_time,
     get_converted_pages,
@@ -30,6 +58,22 @@ from scripts.images.utils import (
 
 logger = logging.getLogger(__name__)
 
+# On-disk page count cache, loaded on first use and written back at exit
+_page_count_cache: Optional[Dict[str, int]] = None
+_page_count_cache_dirty = False
+
+# Outcomes of converting one PDF
+STATUS_OK = "ok"
+STATUS_MISSING = "missing"
+STATUS_CORRUPTED = "corrupted"
+STATUS_ERROR = "error"
+
+# PDF opened once per worker process (see _init_worker), reused by every task it runs
+_worker_pdf = None
+
+# Encode buffers reused across saves in this process (at most two per encode thread)
+_buffer_pool: "queue.LifoQueue[io.BytesIO]" = queue.LifoQueue(maxsize=16)
+
 
 def convert_pdf_to_images(
     pdf_path: str,
@@ -41,34 +85,78 @@ def convert_pdf_to_images(
     test_mode: bool = False,
     batch_size: int = DEFAULT_BATCH_SIZE,
     force: bool = False,
+    png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+    jobs: Optional[int] = None,
 ) -> bool:
     """
-    Convert PDF pages to images with batch processing for better performance.
+    Convert PDF pages to images, rendering page ranges in parallel.
 
     Args:
         pdf_path: Path to the PDF file
         output_dir: Output directory for images
         book_name: Name of the book (for directory naming)
         page_range: Tuple of (start_page, end_page) or None for all pages
-        image_format: Image format ('PNG', 'JPEG', etc.)
+        image_format: Image format ('PNG', 'WEBP', 'JPEG', etc.)
         dpi: DPI for image conversion
         test_mode: If True, only convert first 2 pages
-        batch_size: Number of pages to process at once
+        batch_size: Maximum number of pages per worker task
         force: Force re-conversion of existing pages
+        png_compress_level: zlib compression level (0-9) for PNG output
+        jobs: CPU cores to use for rendering and encoding (None for CPU count)
 
     Returns:
         True if conversion succeeded, False otherwise
     """
+    status, _ = _convert_pdf(
+        pdf_path,
+        output_dir,
+        book_name,
+        page_range,
+        image_format,
+        dpi,
+        test_mode,
+        batch_size,
+        force,
+        png_compress_level,
+        jobs,
+    )
+    return status == STATUS_OK
+
+
+def _convert_pdf(
+    pdf_path: str,
+    output_dir: str,
+    book_name: str,
+    page_range: Optional[Tuple[int, int]],
+    image_format: str,
+    dpi: int,
+    test_mode: bool,
+    batch_size: int,
+    force: bool,
+    png_compress_level: int,
+    jobs: Optional[int],
+) -> Tuple[str, int]:
+    """
+    Convert a PDF, reporting why it failed instead of just whether it did.
+
+    Returns:
+        Tuple of (status, pages_converted), status being one of STATUS_OK,
+        STATUS_MISSING, STATUS_CORRUPTED or STATUS_ERROR
+    """
     if not os.path.exists(pdf_path):
         logger.error(f"PDF file not found: {pdf_path}")
-        return False
+        return STATUS_MISSING, 0
+
+    if not HAS_PYPDFIUM2 and not HAS_PDF2IMAGE:
+        logger.error("pypdfium2 or pdf2image is required for PDF conversion")
+        return STATUS_ERROR, 0
 
     # Check PDF integrity before attempting conversion
     if not check_pdf_integrity(pdf_path):
         logger.error(f"PDF file appears to be corrupted or incomplete: {pdf_path}")
         logger.error("This PDF is missing the EOF marker or has an invalid header.")
         logger.error("The file may have been downloaded incompletely.")
-        return False
+        return STATUS_CORRUPTED, 0
 
     # Create output directory
     book_dir = os.path.join(output_dir, book_name)
@@ -85,9 +173,9 @@ def convert_pdf_to_images(
         converted_pages = get_converted_pages(book_dir, expected_pages) if not force else set()
         missing_pages = expected_pages - converted_pages
 
-        if not missing_pages and not force:
+        if not missing_pages:
             logger.info(f"All {len(expected_pages)} pages for {book_name} are already converted!")
-            return True
+            return STATUS_OK, 0
 
         total_pages_to_convert = len(missing_pages)
         logger.info(
@@ -107,7 +195,9 @@ def convert_pdf_to_images(
         start_time = time.time()
 
         # Get ranges of missing pages for efficient processing
-        missing_ranges = get_missing_page_ranges(expected_pages, converted_pages)
+        missing_ranges = get_missing_page_ranges(
+            expected_pages, converted_pages, coalesce_gap=DEFAULT_COALESCE_GAP
+        )
 
         # Process missing page ranges
         pages_processed = _process_page_ranges(
@@ -115,11 +205,14 @@ def convert_pdf_to_images(
             book_dir=book_dir,
             book_name=book_name,
             missing_ranges=missing_ranges,
+            missing_pages=missing_pages,
             total_pages_to_convert=total_pages_to_convert,
             image_format=image_format,
+            save_options=_get_save_options(image_format, png_compress_level),
             dpi=dpi,
             batch_size=batch_size,
             start_time=start_time,
+            jobs=jobs,
         )
 
         total_time = time.time() - start_time
@@ -137,11 +230,11 @@ def convert_pdf_to_images(
         # Update performance statistics
         update_performance_stats(book_name, pages_processed, dpi, batch_size, total_time)
 
-        return True
+        return STATUS_OK, pages_processed
 
     except Exception as e:
         logger.error(f"Error converting {pdf_path}: {str(e)}")
-        return False
+        return STATUS_ERROR, 0
 
 
 def _get_expected_pages(
@@ -154,8 +247,7 @@ def _get_expected_pages(
         start_page, end_page = page_range
         expected_pages = set(range(start_page, end_page + 1))
     else:
-        info = pdfinfo_from_path(pdf_path)
-        total_pages = info["Pages"]
+        total_pages = _get_page_count(pdf_path)
         expected_pages = set(range(1, total_pages + 1))
 
     if test_mode:
@@ -164,59 +256,447 @@ def _get_expected_pages(
     return expected_pages
 
 
+def _load_page_count_cache() -> Dict[str, int]:
+    """Load the page count cache from disk (once per process)."""
+    global _page_count_cache
+
+    if _page_count_cache is None:
+        _page_count_cache = {}
+        if os.path.exists(PDFINFO_CACHE_FILE):
+            try:
+                with open(PDFINFO_CACHE_FILE, "r") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    _page_count_cache = data
+            except (json.JSONDecodeError, IOError):
+                pass
+        atexit.register(_save_page_count_cache)
+
+    return _page_count_cache
+
+
+def _save_page_count_cache() -> None:
+    """Write the page count cache back to disk if it changed."""
+    if not _page_count_cache_dirty:
+        return
+
+    tmp_path = PDFINFO_CACHE_FILE + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(PDFINFO_CACHE_FILE), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(_page_count_cache, f)
+        os.replace(tmp_path, PDFINFO_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Could not save page count cache: {e}")
+
+
+@lru_cache(maxsize=256)
+def _cached_page_count(pdf_path: str, mtime_ns: int, size: int) -> int:
+    """Get the page count for one version of a PDF, reading it only on a cache miss."""
+    global _page_count_cache_dirty
+
+    cache = _load_page_count_cache()
+    key = f"{pdf_path}:{mtime_ns}:{size}"
+    if key in cache:
+        return cache[key]
+
+    total_pages = _read_page_count(pdf_path)
+
+    # Drop entries for older versions of the same file
+    prefix = f"{pdf_path}:"
+    for stale_key in [k for k in cache if k.startswith(prefix)]:
+        del cache[stale_key]
+    cache[key] = total_pages
+    _page_count_cache_dirty = True
+
+    return total_pages
+
+
+def _get_page_count(pdf_path: str) -> int:
+    """Get the number of pages in a PDF, cached by path, mtime and size."""
+    stat = os.stat(pdf_path)
+    return _cached_page_count(os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_page_count(pdf_path: str) -> int:
+    """Read the number of pages in a PDF, in-process when PDFium is available."""
+    if HAS_PYPDFIUM2:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    return pdfinfo_from_path(pdf_path)["Pages"]
+
+
+def _render_page(pdf, page_num: int, dpi: int):
+    """
+    Render a single page with PDFium.
+
+    Pages without any colour are collapsed to 8-bit grayscale, which
+    makes the saved PNG roughly a third of the size of an RGB one.
+
+    Args:
+        pdf: Open pypdfium2 PdfDocument
+        page_num: 1-based page number
+        dpi: DPI for rendering
+
+    Returns:
+        PIL Image of the rendered page
+    """
+    page = pdf[page_num - 1]
+    try:
+        bitmap = page.render(scale=dpi / 72, rev_byteorder=True)
+        pixels = bitmap.to_numpy()
+        if pixels.ndim == 3 and (pixels[..., 0] == pixels[..., 1]).all() and (
+            pixels[..., 1] == pixels[..., 2]
+        ).all():
+            return Image.fromarray(pixels[..., 0])
+        return bitmap.to_pil()
+    finally:
+        page.close()
+
+
+def _iter_rendered_pages(
+    pdf,
+    pdf_path: str,
+    first_page: int,
+    last_page: int,
+    skip_pages: FrozenSet[int],
+    dpi: int,
+    image_format: str,
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    Yield (page_num, image) for first_page..last_page except skip_pages.
+
+    PDFium renders only the pages needed; pdf2image renders the whole
+    range in one pdftoppm call and the skipped pages are dropped.
+    """
+    if pdf is not None:
+        if not skip_pages:
+            for page_num in range(first_page, last_page + 1):
+                yield page_num, _render_page(pdf, page_num, dpi)
+            return
+
+        for page_num in range(first_page, last_page + 1):
+            if page_num not in skip_pages:
+                yield page_num, _render_page(pdf, page_num, dpi)
+        return
+
+    pages = convert_from_path(
+        pdf_path,
+        dpi=dpi,
+        first_page=first_page,
+        last_page=last_page,
+        fmt=image_format.lower(),
+    )
+    if not skip_pages:
+        yield from zip(range(first_page, last_page + 1), pages)
+        return
+
+    for page_num, page in zip(range(first_page, last_page + 1), pages):
+        if page_num not in skip_pages:
+            yield page_num, page
+
+
+def _get_save_options(image_format: str, png_compress_level: int) -> Dict[str, Any]:
+    """Get the Pillow save() options for an output format."""
+    if image_format == "PNG":
+        return {"compress_level": png_compress_level}
+    if image_format == "WEBP":
+        # Near-lossless quality with the fastest encoder method is plenty for OCR
+        return {"quality": 95, "method": 0, "lossless": False}
+    return {}
+
+
+def _save_page(
+    page: Image.Image,
+    page_num: int,
+    path_prefix: str,
+    image_format: str,
+    save_options: Dict[str, Any],
+) -> None:
+    """
+    Encode and save one rendered page to path_prefix + "NNNNNN.<extension>".
+
+    The page is encoded into a pooled buffer and written with a single
+    write, so the multi-megabyte output buffer is reused instead of being
+    reallocated for every page.
+    """
+    filename = f"{page_num:06d}.{FORMAT_EXTENSIONS[image_format]}"
+    filepath = path_prefix + filename
+
+    try:
+        buffer = _buffer_pool.get_nowait()
+    except queue.Empty:
+        buffer = io.BytesIO()
+
+    try:
+        # Overwrite from the start and cut off what's left of the previous
+        # page; truncating to the current size keeps the allocation
+        buffer.seek(0)
+        page.save(buffer, image_format, **save_options)
+        buffer.truncate()
+        with open(filepath, "wb") as f:
+            f.write(buffer.getbuffer())
+    finally:
+        try:
+            _buffer_pool.put_nowait(buffer)
+        except queue.Full:
+            pass
+
+    logger.debug("Saved page %d: %s", page_num, filename)
+
+
+def _render_range(
+    pdf_path: str,
+    book_dir: str,
+    first_page: int,
+    last_page: int,
+    skip_pages: FrozenSet[int],
+    image_format: str,
+    save_options: Dict[str, Any],
+    dpi: int,
+    encode_threads: int = 1,
+) -> Tuple[int, float]:
+    """
+    Render and save pages first_page..last_page, except skip_pages.
+
+    Top-level so it can run in a worker process; renders from the
+    document opened by _init_worker. Pages are encoded on a small thread
+    pool while the next page renders (both release the GIL); at most two
+    pages per encode thread are held in memory.
+
+    Returns:
+        Tuple of (pages_saved, seconds_taken)
+    """
+    start_time = time.time()
+    pages_saved = 0
+    # Book directory with a trailing separator, joined once for every page
+    path_prefix = os.path.join(book_dir, "")
+
+    with ThreadPoolExecutor(max_workers=encode_threads) as encode_pool:
+        pending = deque()
+        for page_num, page in _iter_rendered_pages(
+            _worker_pdf, pdf_path, first_page, last_page, skip_pages, dpi, image_format
+        ):
+            pending.append(
+                encode_pool.submit(
+                    _save_page, page, page_num, path_prefix, image_format, save_options
+                )
+            )
+            if len(pending) > 2 * encode_threads:
+                pending.popleft().result()
+                pages_saved += 1
+
+        while pending:
+            pending.popleft().result()
+            pages_saved += 1
+
+    return pages_saved, time.time() - start_time
+
+
+def _init_worker(pdf_path: str) -> None:
+    """Open the PDF once for this process, so tasks don't re-parse it for every range."""
+    global _worker_pdf
+    if HAS_PYPDFIUM2:
+        _worker_pdf = pdfium.PdfDocument(pdf_path)
+
+
+def _close_worker_document() -> None:
+    """Close the document opened by _init_worker."""
+    global _worker_pdf
+    if _worker_pdf is not None:
+        _worker_pdf.close()
+        _worker_pdf = None
+
+
+def _split_new_ranges(
+    missing_ranges: List[Tuple[int, int]], chunk_size: int
+) -> List[Tuple[int, int, FrozenSet[int]]]:
+    """Split gapless page ranges (every page missing) into sub-ranges of at most chunk_size pages."""
+    chunks = []
+    no_skip: FrozenSet[int] = frozenset()
+    for range_start, range_end in missing_ranges:
+        for first_page in range(range_start, range_end + 1, chunk_size):
+            chunks.append((first_page, min(first_page + chunk_size - 1, range_end), no_skip))
+    return chunks
+
+
+def _split_incremental_ranges(
+    missing_ranges: List[Tuple[int, int]], missing_pages: Set[int], chunk_size: int
+) -> List[Tuple[int, int, FrozenSet[int]]]:
+    """
+    Split coalesced page ranges into sub-ranges of at most chunk_size missing pages.
+
+    Returns:
+        List of (first_page, last_page, skip_pages) tuples, skip_pages being
+        the already converted pages inside a coalesced range
+    """
+    chunks = []
+    for range_start, range_end in missing_ranges:
+        range_pages = [p for p in range(range_start, range_end + 1) if p in missing_pages]
+        for i in range(0, len(range_pages), chunk_size):
+            first_page = range_pages[i]
+            last_page = range_pages[min(i + chunk_size, len(range_pages)) - 1]
+            skip_pages = frozenset(
+                p for p in range(first_page, last_page + 1) if p not in missing_pages
+            )
+            chunks.append((first_page, last_page, skip_pages))
+    return chunks
+
+
+def _get_available_memory() -> Optional[int]:
+    """
+    Get the memory available to new processes in bytes, or None if unknown.
+
+    Uses MemAvailable from /proc/meminfo where it exists, since it counts
+    reclaimable page cache that SC_AVPHYS_PAGES (MemFree on Linux) leaves out.
+    """
+    try:
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _get_worker_count(dpi: int, task_count: int, jobs: int) -> int:
+    """
+    Get the number of conversion worker processes.
+
+    Bounded by the number of jobs, the number of tasks and available memory
+    (roughly 0.3 GB per worker at 150 DPI, growing with the pixel count).
+    """
+    workers = min(jobs, task_count)
+
+    available = _get_available_memory()
+    if available is None:
+        return max(1, workers)
+
+    available_gb = available / 1024**3
+
+    memory_workers = int(available_gb / ((dpi / 150) ** 2 * 0.3))
+    return max(1, min(workers, memory_workers))
+
+
 def _process_page_ranges(
     pdf_path: str,
     book_dir: str,
     book_name: str,
     missing_ranges: List[Tuple[int, int]],
+    missing_pages: Set[int],
     total_pages_to_convert: int,
     image_format: str,
+    save_options: Dict[str, Any],
     dpi: int,
     batch_size: int,
     start_time: float,
+    jobs: Optional[int] = None,
 ) -> int:
-    """Process missing page ranges and return number of pages processed."""
-    pages_processed = 0
-
-    with tqdm(total=total_pages_to_convert, desc=f"Converting {book_name}", unit="pages") as pbar:
-        for range_start, range_end in missing_ranges:
-            range_pages = list(range(range_start, range_end + 1))
+    """
+    Process missing page ranges and return number of pages processed.
 
-            # Process this range in batches
-            for i in range(0, len(range_pages), batch_size):
-                batch_start_time = time.time()
-                batch_pages = range_pages[i : i + batch_size]
+    Ranges are split into sub-ranges of at most batch_size pages (smaller
+    when needed to give every worker several tasks), which are rendered in
+    parallel by a process pool.
+    """
+    pages_processed = 0
 
-                # Convert batch
-                pages = convert_from_path(
+    jobs = jobs or os.cpu_count() or 1
+    workers = _get_worker_count(dpi, total_pages_to_convert, jobs)
+    # Cores left over per worker go to its encode threads
+    encode_threads = max(1, min(8, jobs // workers))
+    chunk_size = max(1, min(batch_size, math.ceil(total_pages_to_convert / (workers * 4))))
+    # Without gaps inside the ranges (a fresh or forced conversion) no task has
+    # pages to skip, so the per-page membership checks can be left out entirely
+    gapless = total_pages_to_convert == sum(end - start + 1 for start, end in missing_ranges)
+    if gapless:
+        tasks = _split_new_ranges(missing_ranges, chunk_size)
+    else:
+        tasks = _split_incremental_ranges(missing_ranges, missing_pages, chunk_size)
+
+    with tqdm(
+        total=total_pages_to_convert, desc=f"Converting {book_name}", unit="pages"
+    ) as pbar, ConvertedPagesSidecar(book_dir) as sidecar:
+
+        def record(
+            task: Tuple[int, int, FrozenSet[int]], batch_count: int, batch_time: float
+        ) -> None:
+            nonlocal pages_processed
+            pages_processed += batch_count
+            pbar.update(batch_count)
+
+            # Pages are saved in order, so the first batch_count non-skipped ones exist
+            first_page, last_page, skip_pages = task
+            if skip_pages:
+                saved_pages = [p for p in range(first_page, last_page + 1) if p not in skip_pages]
+                sidecar.mark(saved_pages[:batch_count])
+            else:
+                sidecar.mark(range(first_page, first_page + batch_count))
+
+            # Update progress bar with ETA
+            _update_progress_bar(
+                pbar=pbar,
+                pages_processed=pages_processed,
+                total_pages_to_convert=total_pages_to_convert,
+                batch_count=batch_count,
+                batch_time=batch_time,
+                elapsed=time.time() - start_time,
+            )
+
+        if workers == 1:
+            _init_worker(pdf_path)
+            try:
+                for task in tasks:
+                    record(
+                        task,
+                        *_render_range(
+                            pdf_path,
+                            book_dir,
+                            *task,
+                            image_format,
+                            save_options,
+                            dpi,
+                            encode_threads,
+                        ),
+                    )
+            finally:
+                _close_worker_document()
+            return pages_processed
+
+        logger.debug(f"Rendering {len(tasks)} sub-ranges with {workers} workers")
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(pdf_path,)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _render_range,
                     pdf_path,
-                    dpi=dpi,
-                    first_page=min(batch_pages),
-                    last_page=max(batch_pages),
-                    fmt=image_format.lower(),
-                )
-
-                # Save batch pages
-                for j, page in enumerate(pages):
-                    page_num = batch_pages[j]
-                    filename = f"{page_num:06d}.png"
-                    filepath = os.path.join(book_dir, filename)
-                    page.save(filepath, image_format)
-                    logger.debug(f"Saved page {page_num}: {filename}")
-
-                batch_count = len(pages)
-                pages_processed += batch_count
-                pbar.update(batch_count)
-
-                # Update progress bar with ETA
-                _update_progress_bar(
-                    pbar=pbar,
-                    pages_processed=pages_processed,
-                    total_pages_to_convert=total_pages_to_convert,
-                    batch_count=batch_count,
-                    batch_time=time.time() - batch_start_time,
-                    elapsed=time.time() - start_time,
-                )
+                    book_dir,
+                    *task,
+                    image_format,
+                    save_options,
+                    dpi,
+                    encode_threads,
+                ): task
+                for task in tasks
+            }
+            try:
+                for future in as_completed(futures):
+                    record(futures[future], *future.result())
+            except BaseException:
+                # Don't keep rendering the rest of the book after a failure
+                for future in futures:
+                    future.cancel()
+                raise
 
     return pages_processed
 
@@ -255,6 +735,8 @@ def process_books(
     test_mode: bool = False,
     batch_size: int = DEFAULT_BATCH_SIZE,
     force: bool = False,
+    png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL,
+    jobs: Optional[int] = None,
 ) -> bool:
     """
     Process multiple books for image conversion.
@@ -266,8 +748,10 @@ def process_books(
         image_format: Image format
         dpi: DPI for conversion
         test_mode: Test mode (first 2 pages only)
-        batch_size: Number of pages to process at once
+        batch_size: Maximum number of pages per worker task
         force: Force re-conversion
+        png_compress_level: zlib compression level (0-9) for PNG output
+        jobs: CPU cores to use for rendering and encoding (None for CPU count)
 
     Returns:
         True if all books converted successfully, False otherwise
@@ -283,29 +767,31 @@ def process_books(
 
         logger.info(f"Processing {book_name}...")
 
-        if convert_pdf_to_images(
-            pdf_path=pdf_path,
-            output_dir=output_dir,
-            book_name=book_name,
-            page_range=page_range,
-            image_format=image_format,
-            dpi=dpi,
-            test_mode=test_mode,
-            batch_size=batch_size,
-            force=force,
-        ):
+        status, _ = _convert_pdf(
+            pdf_path,
+            output_dir,
+            book_name,
+            page_range,
+            image_format,
+            dpi,
+            test_mode,
+            batch_size,
+            force,
+            png_compress_level,
+            jobs,
+        )
+
+        if status == STATUS_OK:
             success_count += 1
+        elif status in (STATUS_MISSING, STATUS_CORRUPTED):
+            corrupted_count += 1
+            logger.error(f"PDF is {status}: {book_name}")
         else:
-            # Check if it was due to corruption
-            if not check_pdf_integrity(pdf_path):
-                corrupted_count += 1
-                logger.error(f"PDF is corrupted: {book_name}")
-            else:
-                logger.error(f"Conversion failed for unknown reason: {book_name}")
+            logger.error(f"Conversion failed for unknown reason: {book_name}")
 
     logger.info(f"Completed: {success_count}/{total_books} books processed successfully")
     if corrupted_count > 0:
-        logger.warning(f"{corrupted_count} PDFs were corrupted and need re-download")
+        logger.warning(f"{corrupted_count} PDFs were missing or corrupted and need re-download")
         logger.info("Run: python -m scripts.pdf <book_names> to re-download")
 
     return success_count == total_books
@@ -85,6 +85,8 @@ def main() -> None:
             test_mode=args.test,
             batch_size=args.batch_size,
             force=args.force,
+            png_compress_level=args.png_compress_level,
+            jobs=args.jobs,
         )
 
         if not success:
@@ -104,6 +106,8 @@ def main() -> None:
         test_mode=args.test,
         batch_size=args.batch_size,
         force=args.force,
+        png_compress_level=args.png_compress_level,
+        jobs=args.jobs,
     )
 
     if not success:
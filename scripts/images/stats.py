@@ -8,16 +8,51 @@ import os
 import time
 from typing import Dict, Optional, Tuple
 
-from scripts.images.constants import PERF_STATS_FILE
+from scripts.images.constants import (
+    LEGACY_PERF_STATS_FILE,
+    PERF_STATS_COMPACT_RATIO,
+    PERF_STATS_FILE,
+)
 
 logger = logging.getLogger(__name__)
 
 
 def load_performance_stats() -> Dict:
-    """Load performance statistics from file."""
-    if os.path.exists(PERF_STATS_FILE):
+    """
+    Load performance statistics from file.
+
+    The log is folded by key with the last entry winning, and compacted
+    once it holds many superseded entries.
+    """
+    if not os.path.exists(PERF_STATS_FILE):
+        return _load_legacy_performance_stats()
+
+    stats = {}
+    line_count = 0
+    try:
+        with open(PERF_STATS_FILE, "r") as f:
+            for line in f:
+                line_count += 1
+                try:
+                    entry = json.loads(line)
+                    stats[entry.pop("key")] = entry
+                except (json.JSONDecodeError, KeyError, AttributeError, TypeError):
+                    # Skip a line cut short by an interrupted append
+                    continue
+    except IOError:
+        return {}
+
+    if line_count > PERF_STATS_COMPACT_RATIO * max(1, len(stats)):
+        save_performance_stats(stats)
+
+    return stats
+
+
+def _load_legacy_performance_stats() -> Dict:
+    """Load statistics from the old single-JSON-document stats file."""
+    if os.path.exists(LEGACY_PERF_STATS_FILE):
         try:
-            with open(PERF_STATS_FILE, "r") as f:
+            with open(LEGACY_PERF_STATS_FILE, "r") as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError):
             pass
@@ -25,11 +60,14 @@ def load_performance_stats() -> Dict:
 
 
 def save_performance_stats(stats: Dict) -> None:
-    """Save performance statistics to file."""
+    """Save performance statistics to file, replacing the whole log with one line per key."""
     os.makedirs(os.path.dirname(PERF_STATS_FILE), exist_ok=True)
+    tmp_path = PERF_STATS_FILE + ".tmp"
     try:
-        with open(PERF_STATS_FILE, "w") as f:
-            json.dump(stats, f, indent=2)
+        with open(tmp_path, "w") as f:
+            for key, entry in stats.items():
+                f.write(json.dumps({"key": key, **entry}) + "\n")
+        os.replace(tmp_path, PERF_STATS_FILE)
     except Exception as e:
         logger.warning(f"Could not save performance stats: {e}")
 
@@ -89,12 +127,12 @@ def update_performance_stats(
         batch_size: Batch size used
         actual_time: Actual time taken in seconds
     """
-    stats = load_performance_stats()
     key = f"{book_name}_{dpi}_{batch_size}"
 
     pages_per_sec = total_pages / actual_time if actual_time > 0 else 1.0
 
-    stats[key] = {
+    entry = {
+        "key": key,
         "pages_per_sec": pages_per_sec,
         "total_pages": total_pages,
         "dpi": dpi,
@@ -102,5 +140,13 @@ def update_performance_stats(
         "last_updated": time.time(),
     }
 
-    save_performance_stats(stats)
+    # Carry entries over from the old JSON file before the first append
+    if not os.path.exists(PERF_STATS_FILE):
+        save_performance_stats(_load_legacy_performance_stats())
 
+    # Append a single line instead of rewriting every entry
+    try:
+        with open(PERF_STATS_FILE, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+    except Exception as e:
+        logger.warning(f"Could not save performance stats: {e}")
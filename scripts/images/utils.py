@@ -3,13 +3,30 @@ Utility functions for PDF to Images conversion.
 """
 
 import os
-from typing import List, Optional, Set, Tuple
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from scripts.images.constants import CONVERTED_PAGES_SIDECAR, FORMAT_EXTENSIONS
+
+# Converted pages are saved as f"{page_num:06d}.{extension}" in any supported format
+PAGE_FILENAME_PATTERN = re.compile(
+    rf"^(\d{{6}})\.(?:{'|'.join(FORMAT_EXTENSIONS.values())})$"
+)
+
+# book_dir -> (directory mtime_ns, converted pages) from the last scan
+_converted_pages_cache: Dict[str, Tuple[int, FrozenSet[int]]] = {}
 
 
 def check_pdf_integrity(pdf_path: str) -> bool:
     """
     Check if a PDF file is complete and valid.
 
+    Results are memoized per file version (path, mtime and size), so
+    checking the same PDF again costs a single stat.
+
     Args:
         pdf_path: Path to the PDF file
 
@@ -17,24 +34,52 @@ def check_pdf_integrity(pdf_path: str) -> bool:
         True if PDF appears to be complete, False otherwise
     """
     try:
-        with open(pdf_path, "rb") as f:
-            # Check header
-            f.seek(0)
-            header = f.read(20)
-            if not header.startswith(b"%PDF-"):
-                return False
-
-            # Check EOF marker at the end
-            f.seek(0, 2)
-            size = f.tell()
-            f.seek(max(0, size - 100))
-            end_content = f.read(100)
-            if b"%%EOF" not in end_content:
-                return False
-
-            return True
-    except Exception:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return False
+
+    return _check_pdf_integrity(os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _check_pdf_integrity(pdf_path: str, mtime_ns: int, size: int) -> bool:
+    """Check the header and EOF marker of one version of a PDF."""
+    try:
+        fd = os.open(pdf_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return False
+
+    try:
+        # Check header
+        header = _read_at(fd, 20, 0)
+        if not header.startswith(b"%PDF-"):
+            return False
+
+        # Check EOF marker at the end; it is almost always in the last few
+        # bytes, so search backwards from the end instead of scanning forwards
+        end_content = _read_at(fd, 100, max(0, size - 100))
+        return end_content.rfind(b"%%EOF") != -1
+    except OSError:
         return False
+    finally:
+        os.close(fd)
+
+
+def _read_at(fd: int, length: int, offset: int) -> bytes:
+    """Read length bytes at offset with one pread (seek + read where pread is unavailable)."""
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, length)
+
+
+def _write_at(fd: int, data: bytes, offset: int) -> None:
+    """Write data at offset with one pwrite (seek + write where pwrite is unavailable)."""
+    if hasattr(os, "pwrite"):
+        os.pwrite(fd, data, offset)
+        return
+    os.lseek(fd, offset, os.SEEK_SET)
+    os.write(fd, data)
 
 
 def get_converted_pages(book_dir: str, expected_pages: Set[int]) -> Set[int]:
@@ -48,25 +93,132 @@ def get_converted_pages(book_dir: str, expected_pages: Set[int]) -> Set[int]:
     Returns:
         Set of page numbers that are already converted
     """
-    converted_pages = set()
+    try:
+        mtime_ns = os.stat(book_dir).st_mtime_ns
+    except OSError:
+        return set()
 
-    if not os.path.exists(book_dir):
-        return converted_pages
+    # Adding or removing a page changes the directory mtime, so an
+    # unchanged mtime means the previous scan is still valid
+    cached = _converted_pages_cache.get(book_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return set(cached[1])
 
-    for filename in os.listdir(book_dir):
-        if filename.endswith(".png") and filename[0].isdigit():
-            try:
-                page_num = int(filename.split(".")[0])
-                converted_pages.add(page_num)
-            except ValueError:
-                continue
+    converted_pages = _read_converted_pages_sidecar(book_dir, mtime_ns)
+    if converted_pages is None:
+        converted_pages = _scan_converted_pages(book_dir)
+        _write_converted_pages_sidecar(book_dir, converted_pages)
 
+    _converted_pages_cache[book_dir] = (mtime_ns, frozenset(converted_pages))
     return converted_pages
 
 
+def _scan_converted_pages(book_dir: str) -> Set[int]:
+    """List the page numbers of the page images present in a book directory."""
+    match = PAGE_FILENAME_PATTERN.match
+    with os.scandir(book_dir) as entries:
+        return {
+            int(m.group(1)) for entry in entries if (m := match(entry.name)) and entry.is_file()
+        }
+
+
+def _read_converted_pages_sidecar(book_dir: str, dir_mtime_ns: int) -> Optional[Set[int]]:
+    """
+    Read the converted pages bitmap, or None if it is missing or stale.
+
+    The sidecar is only trusted when it was written after the last change
+    to the directory; a page added or deleted since then makes it stale.
+    """
+    sidecar_path = os.path.join(book_dir, CONVERTED_PAGES_SIDECAR)
+    try:
+        with open(sidecar_path, "rb") as f:
+            if os.fstat(f.fileno()).st_mtime_ns < dir_mtime_ns:
+                return None
+            bits = f.read()
+    except OSError:
+        return None
+
+    mask = np.unpackbits(np.frombuffer(bits, dtype=np.uint8), bitorder="little")
+    return set(np.flatnonzero(mask).tolist())
+
+
+def _write_converted_pages_sidecar(book_dir: str, pages: Iterable[int]) -> None:
+    """Rewrite the converted pages bitmap (in place, so the directory mtime is untouched once it exists)."""
+    bits = bytearray()
+    for page_num in pages:
+        byte_index = page_num >> 3
+        if byte_index >= len(bits):
+            bits.extend(bytes(byte_index + 1 - len(bits)))
+        bits[byte_index] |= 1 << (page_num & 7)
+
+    sidecar_path = os.path.join(book_dir, CONVERTED_PAGES_SIDECAR)
+    try:
+        fd = os.open(sidecar_path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            os.ftruncate(fd, 0)
+            _write_at(fd, bits, 0)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+class ConvertedPagesSidecar:
+    """
+    Record converted pages in a book directory's bitmap sidecar.
+
+    One bit per page (bit page_num % 8 of byte page_num // 8); only the
+    bytes touched by a marked range are written back.
+    """
+
+    def __init__(self, book_dir: str):
+        """
+        Open (or create) the sidecar for a book directory.
+
+        A missing or stale sidecar is first rebuilt from a directory scan, so
+        pages converted before it existed (or by a --force run, which skips
+        get_converted_pages) are not forgotten.
+        """
+        if _read_converted_pages_sidecar(book_dir, os.stat(book_dir).st_mtime_ns) is None:
+            _write_converted_pages_sidecar(book_dir, _scan_converted_pages(book_dir))
+        self.fd = os.open(
+            os.path.join(book_dir, CONVERTED_PAGES_SIDECAR),
+            os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self.bits = bytearray(os.read(self.fd, os.fstat(self.fd).st_size))
+
+    def mark(self, pages: Sequence[int]) -> None:
+        """Mark pages (in ascending order) as converted."""
+        if not pages:
+            return
+
+        first_byte = pages[0] >> 3
+        last_byte = pages[-1] >> 3
+        if last_byte >= len(self.bits):
+            self.bits.extend(bytes(last_byte + 1 - len(self.bits)))
+
+        bits = self.bits
+        for page_num in pages:
+            bits[page_num >> 3] |= 1 << (page_num & 7)
+
+        _write_at(self.fd, bits[first_byte : last_byte + 1], first_byte)
+
+    def close(self) -> None:
+        """Close the sidecar file."""
+        os.close(self.fd)
+
+    def __enter__(self) -> "ConvertedPagesSidecar":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 def get_missing_page_ranges(
     expected_pages: Set[int],
     converted_pages: Set[int],
+    coalesce_gap: int = 0,
 ) -> List[Tuple[int, int]]:
     """
     Get ranges of missing pages for efficient batch processing.
@@ -74,6 +226,8 @@ def get_missing_page_ranges(
     Args:
         expected_pages: Set of expected page numbers
         converted_pages: Set of already converted page numbers
+        coalesce_gap: Merge runs separated by at most this many converted
+            pages into one range (callers skip the converted pages inside)
 
     Returns:
         List of (start, end) tuples representing missing page ranges
@@ -81,23 +235,17 @@ def get_missing_page_ranges(
     if not expected_pages:
         return []
 
-    missing_pages = sorted(set(expected_pages) - converted_pages)
+    missing_pages = expected_pages - converted_pages
     if not missing_pages:
         return []
 
-    # Convert to ranges
-    ranges = []
-    start = missing_pages[0]
-    prev = missing_pages[0]
-
-    for page in missing_pages[1:]:
-        if page != prev + 1:
-            ranges.append((start, prev))
-            start = page
-        prev = page
+    # A run ends wherever more than coalesce_gap pages separate two missing pages
+    pages = np.fromiter(sorted(missing_pages), dtype=np.int64, count=len(missing_pages))
+    breaks = np.flatnonzero(np.diff(pages) > 1 + coalesce_gap)
+    starts = pages[np.concatenate(([0], breaks + 1))]
+    ends = pages[np.concatenate((breaks, [len(pages) - 1]))]
 
-    ranges.append((start, prev))
-    return ranges
+    return list(zip(starts.tolist(), ends.tolist()))
 
 
 def parse_page_range(page_range_str: str) -> Optional[Tuple[int, int]]: